@@ -15,15 +15,24 @@ __author__ = "RUTOS Starlink Project"
 
 # Import main classes for easy access
 from .data_downloader import DataDownloader
-from .log_parser import LogParser
+from .log_parser import LogEntry, LogParser
 from .performance_analyzer import PerformanceAnalyzer
-from .visualizer import Visualizer
 from .network_analyzer import NetworkAnalyzer
 
 __all__ = [
     "DataDownloader",
+    "LogEntry",
     "LogParser",
     "PerformanceAnalyzer",
     "Visualizer",
     "NetworkAnalyzer",
 ]
+
+
+def __getattr__(name):
+    # The visualizer pulls in matplotlib, so it is only imported when asked for
+    if name == "Visualizer":
+        from .visualizer import Visualizer
+
+        return Visualizer
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
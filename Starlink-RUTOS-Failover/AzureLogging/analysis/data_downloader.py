@@ -6,130 +6,419 @@ Data Downloader Module
 Handles downloading data from Azure Storage containers.
 """
 
+import asyncio
+import codecs
 import logging
-from datetime import datetime, timedelta
-from typing import Optional
+import os
+from concurrent.futures import ProcessPoolExecutor
+from datetime import date, datetime, timedelta
+from typing import List, Optional
 import re
 
-from azure.storage.blob import BlobServiceClient
-from azure.identity import DefaultAzureCredential
+import aiohttp
+import pandas as pd
+from azure.core.pipeline.transport import AioHttpTransport
+from azure.storage.blob.aio import BlobServiceClient as AioBlobServiceClient
+from azure.identity.aio import DefaultAzureCredential
+
+from .log_parser import LogParser
 
 logger = logging.getLogger(__name__)
 
+# Blob names are a prefix followed by the day they cover, as written by the
+# log shipper and the HttpLogIngestor function
+_BLOB_NAME_PREFIXES = ("", "router-", "starlink-performance-")
+
+# First date on each line of a newline-joined listing of blob names
+_FIRST_DATE_PER_LINE_RE = re.compile(r"^.*?(\d{4}-\d{2}-\d{2})", re.MULTILINE)
+
+# Maximum number of blob downloads in flight at once
+DEFAULT_MAX_CONCURRENCY = 32
+
+# Shared connection pool settings (log and CSV blobs are small, keep sockets warm)
+CONNECTION_POOL_LIMIT = 64
+DNS_CACHE_TTL_SECONDS = 300
+KEEPALIVE_TIMEOUT_SECONDS = 75
+CONNECTION_TIMEOUT_SECONDS = 20
+READ_TIMEOUT_SECONDS = 120
+
+# Size of each ranged GET when streaming blob content into the parser
+STREAM_CHUNK_SIZE = 4 * 1024 * 1024
+
+# Parsed blocks waiting for a parse worker (bounds memory to a few blocks)
+PARSE_QUEUE_SIZE = 8
+
 
 class DataDownloader:
     """
     Downloads system logs and performance data from Azure Storage
     """
 
-    def __init__(self, storage_account: str, credential=None):
+    def __init__(
+        self,
+        storage_account: str,
+        credential=None,
+        max_concurrency: int = DEFAULT_MAX_CONCURRENCY,
+        parse_workers: Optional[int] = None,
+    ):
         """
         Initialize the downloader with Azure Storage credentials
 
         Args:
             storage_account: Azure Storage account name
-            credential: Azure credential (defaults to DefaultAzureCredential)
+            credential: Async Azure credential (defaults to DefaultAzureCredential)
+            max_concurrency: Maximum number of concurrent blob downloads
+            parse_workers: Processes parsing the downloaded blocks (defaults
+                to the CPU count)
         """
         self.storage_account = storage_account
-        self.credential = credential or DefaultAzureCredential()
+        self.account_url = f"https://{storage_account}.blob.core.windows.net"
+        self.credential = credential
+        self.max_concurrency = max_concurrency
+        self.parse_workers = parse_workers or os.cpu_count() or 1
 
-        # Initialize Azure Storage client with managed identity
-        self.blob_client = BlobServiceClient(
-            account_url=f"https://{storage_account}.blob.core.windows.net",
-            credential=self.credential,
-        )
+        # Long-lived async state, created lazily on the downloader's own event
+        # loop so TLS sessions stay warm between download_data calls
+        self._loop = None
+        self._session = None
+        self._service_client = None
+        self._owns_credential = credential is None
+
+        self.parser = LogParser()
 
         # Data containers
         self.system_logs = []
-        self.performance_data = []
+        self.performance_data = pd.DataFrame()
+        self._performance_frames = []
+
+        # (days_back, day) of the data currently held, to skip re-downloads
+        self._cache_key = None
 
     def download_data(self, days_back: int = 30) -> None:
         """
         Download system logs and performance data from Azure Storage
 
+        Replaces any previously downloaded data. Repeating a request for the
+        same window on the same day reuses the data already in memory.
+
         Args:
             days_back: Number of days to analyze (default: 30)
         """
-        logger.info(f"Downloading data for the last {days_back} days...")
+        cache_key = (days_back, date.today())
+        if cache_key == self._cache_key:
+            logger.info("Reusing downloaded data for the last %s days", days_back)
+            return
+
+        logger.info("Downloading data for the last %s days...", days_back)
 
         end_date = datetime.now()
         start_date = end_date - timedelta(days=days_back)
 
+        self.system_logs = []
+        self._performance_frames = []
+        self._cache_key = None
+
         try:
-            # Download system logs
-            system_container = self.blob_client.get_container_client("system-logs")
-            self._download_logs(system_container, start_date, end_date, "system")
+            self._run(self._download_all(start_date, end_date))
 
-            # Download performance data
-            performance_container = self.blob_client.get_container_client(
-                "starlink-performance"
-            )
-            self._download_logs(
-                performance_container, start_date, end_date, "performance"
+            # Blocks finish parsing in any order, so restore time order once
+            self.system_logs.sort(key=lambda entry: entry.timestamp)
+
+            # Combine the per-block frames once instead of growing row lists
+            self.performance_data = (
+                pd.concat(self._performance_frames, ignore_index=True).sort_values(
+                    "timestamp", ignore_index=True, kind="stable"
+                )
+                if self._performance_frames
+                else pd.DataFrame()
             )
+            self._performance_frames = []
+            self._cache_key = cache_key
 
-            logger.info(f"Downloaded {len(self.system_logs)} system log entries")
+            logger.info("Downloaded %s system log entries", len(self.system_logs))
             logger.info(
-                f"Downloaded {len(self.performance_data)} performance data points"
+                "Downloaded %s performance data points", len(self.performance_data)
             )
 
         except Exception as e:
-            logger.error(f"Error downloading data: {e}")
+            logger.error("Error downloading data: %s", e)
             raise
 
-    def _download_logs(
-        self, container_client, start_date: datetime, end_date: datetime, log_type: str
+    def close(self) -> None:
+        """
+        Close the pooled connections and the downloader's event loop
+        """
+        if self._loop is not None and not self._loop.is_closed():
+            self._loop.run_until_complete(self.aclose())
+            self._loop.close()
+        self._loop = None
+
+    async def aclose(self) -> None:
+        """
+        Close the aio client, the shared aiohttp session and any owned credential
+        """
+        if self._service_client is not None:
+            await self._service_client.close()
+            self._service_client = None
+
+        if self._session is not None:
+            await self._session.close()
+            self._session = None
+
+        # Only close credentials we created ourselves
+        if self._owns_credential and self.credential is not None:
+            await self.credential.close()
+            self.credential = None
+
+    def _run(self, coro):
+        """
+        Run a coroutine on the downloader's long-lived event loop
+        """
+        if self._loop is None or self._loop.is_closed():
+            self._loop = asyncio.new_event_loop()
+        return self._loop.run_until_complete(coro)
+
+    def _get_service_client(self) -> AioBlobServiceClient:
+        """
+        Return the shared aio client, creating it and its connection pool on first use
+        """
+        if self._service_client is None:
+            if self.credential is None:
+                self.credential = DefaultAzureCredential()
+
+            self._session = aiohttp.ClientSession(
+                connector=aiohttp.TCPConnector(
+                    limit=CONNECTION_POOL_LIMIT,
+                    ttl_dns_cache=DNS_CACHE_TTL_SECONDS,
+                    keepalive_timeout=KEEPALIVE_TIMEOUT_SECONDS,
+                )
+            )
+            self._service_client = AioBlobServiceClient(
+                account_url=self.account_url,
+                credential=self.credential,
+                transport=AioHttpTransport(session=self._session, session_owner=False),
+                connection_timeout=CONNECTION_TIMEOUT_SECONDS,
+                read_timeout=READ_TIMEOUT_SECONDS,
+            )
+        return self._service_client
+
+    async def _download_all(self, start_date: datetime, end_date: datetime) -> None:
+        """
+        Download both containers concurrently over the shared aio client
+
+        Downloads feed a bounded queue of text blocks that parse workers
+        drain into a process pool, so parsing overlaps network I/O.
+        """
+        semaphore = asyncio.Semaphore(self.max_concurrency)
+        queue: asyncio.Queue = asyncio.Queue(maxsize=PARSE_QUEUE_SIZE)
+        service_client = self._get_service_client()
+
+        system_container = service_client.get_container_client("system-logs")
+        performance_container = service_client.get_container_client(
+            "starlink-performance"
+        )
+
+        workers = self.parse_workers
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            consumers = [
+                asyncio.ensure_future(self._parse_worker(queue, executor))
+                for _ in range(workers)
+            ]
+            try:
+                await asyncio.gather(
+                    self._download_logs(
+                        system_container,
+                        start_date,
+                        end_date,
+                        "system",
+                        semaphore,
+                        queue,
+                    ),
+                    self._download_logs(
+                        performance_container,
+                        start_date,
+                        end_date,
+                        "performance",
+                        semaphore,
+                        queue,
+                    ),
+                )
+
+                # One sentinel per worker once every block has been queued
+                for _ in consumers:
+                    await queue.put(None)
+                await asyncio.gather(*consumers)
+            finally:
+                for consumer in consumers:
+                    consumer.cancel()
+
+    async def _parse_worker(
+        self, queue: asyncio.Queue, executor: ProcessPoolExecutor
+    ) -> None:
+        """
+        Parse queued blocks in the process pool until a sentinel arrives
+
+        Results are collected on the event loop thread, so the shared lists
+        need no locking.
+        """
+        loop = asyncio.get_running_loop()
+
+        while True:
+            item = await queue.get()
+            if item is None:
+                return
+
+            block, blob_date, log_type = item
+            try:
+                if log_type == "system":
+                    entries = await loop.run_in_executor(
+                        executor, self.parser.parse_system_logs, block, blob_date
+                    )
+                    self.system_logs.extend(entries)
+                elif log_type == "performance":
+                    df = await loop.run_in_executor(
+                        executor, self.parser.parse_performance_data, block, blob_date
+                    )
+                    if not df.empty:
+                        self._performance_frames.append(df)
+            except Exception as e:
+                logger.error("Error parsing %s data for %s: %s", log_type, blob_date, e)
+
+    async def _download_logs(
+        self,
+        container_client,
+        start_date: datetime,
+        end_date: datetime,
+        log_type: str,
+        semaphore: asyncio.Semaphore,
+        queue: asyncio.Queue,
     ) -> None:
         """
         Download logs from a specific container within date range
         """
         try:
-            blobs = container_client.list_blobs()
+            # Ask the service only for blobs named after a day in the window
+            # instead of listing the whole container and filtering client-side
+            days = (end_date.date() - start_date.date()).days + 1
+            window = [start_date.date() + timedelta(days=i) for i in range(days)]
+            prefixes = [
+                (day, prefix)
+                for day in window
+                for prefix in (
+                    f"{name}{day.isoformat()}" for name in _BLOB_NAME_PREFIXES
+                )
+            ]
 
-            for blob in blobs:
-                # Parse date from blob name (assuming format: router-YYYY-MM-DD.log or YYYY-MM-DD.csv)
-                blob_date = self._extract_date_from_blob_name(blob.name)
-
-                if blob_date and start_date.date() <= blob_date <= end_date.date():
-                    logger.info(f"Downloading {blob.name}")
+            listings = await asyncio.gather(
+                *(
+                    self._list_blob_names(container_client, prefix, semaphore)
+                    for _, prefix in prefixes
+                )
+            )
 
-                    blob_client = container_client.get_blob_client(blob.name)
-                    content = blob_client.download_blob().readall().decode("utf-8")
+            downloads = []
+            for (day, _), blob_names in zip(prefixes, listings):
+                # Sanity check that the embedded date is the one we listed
+                for blob_name in self._names_dated(blob_names, day):
+                    downloads.append(
+                        self._download_blob(
+                            container_client,
+                            blob_name,
+                            day,
+                            log_type,
+                            semaphore,
+                            queue,
+                        )
+                    )
 
-                    if log_type == "system":
-                        self._parse_system_logs(content, blob_date)
-                    elif log_type == "performance":
-                        self._parse_performance_data(content, blob_date)
+            await asyncio.gather(*downloads)
 
         except Exception as e:
-            logger.error(f"Error downloading {log_type} logs: {e}")
+            logger.error("Error downloading %s logs: %s", log_type, e)
             raise
 
-    def _extract_date_from_blob_name(self, blob_name: str) -> Optional[datetime.date]:
+    @staticmethod
+    async def _list_blob_names(
+        container_client, prefix: str, semaphore: asyncio.Semaphore
+    ) -> List[str]:
         """
-        Extract date from blob name (router-YYYY-MM-DD.log or YYYY-MM-DD.csv)
+        List the names of blobs starting with prefix
         """
-        # Pattern for router-YYYY-MM-DD.log or YYYY-MM-DD.csv
-        date_pattern = r"(\d{4}-\d{2}-\d{2})"
-        match = re.search(date_pattern, blob_name)
+        async with semaphore:
+            return [
+                blob.name
+                async for blob in container_client.list_blobs(name_starts_with=prefix)
+            ]
 
-        if match:
-            try:
-                return datetime.strptime(match.group(1), "%Y-%m-%d").date()
-            except ValueError:
-                return None
-        return None
+    @staticmethod
+    def _names_dated(blob_names: List[str], day: date) -> List[str]:
+        """
+        Return the blob names whose first embedded date is day, in order
+
+        Scans the whole listing in one regex pass rather than once per name.
+        """
+        joined = "\n".join(blob_names)
+        wanted = day.isoformat()
 
-    def _parse_system_logs(self, content: str, log_date: datetime.date) -> None:
+        matched = []
+        line = 0
+        line_start = 0
+        for match in _FIRST_DATE_PER_LINE_RE.finditer(joined):
+            # Matches begin at a line start; advance the running line index
+            line += joined.count("\n", line_start, match.start())
+            line_start = match.start()
+            if match.group(1) == wanted:
+                matched.append(blob_names[line])
+
+        return matched
+
+    async def _download_blob(
+        self,
+        container_client,
+        blob_name: str,
+        blob_date: datetime.date,
+        log_type: str,
+        semaphore: asyncio.Semaphore,
+        queue: asyncio.Queue,
+    ) -> None:
         """
-        Parse system log content and extract relevant events
+        Download a single blob and queue its text blocks for parsing
         """
-        # This will be moved to LogParser module
-        pass
+        async with semaphore:
+            if logger.isEnabledFor(logging.INFO):
+                logger.info("Downloading %s", blob_name)
+
+            blob_client = container_client.get_blob_client(blob_name)
+            stream = await blob_client.download_blob(
+                max_concurrency=1, max_chunk_get_size=STREAM_CHUNK_SIZE
+            )
+
+            # Hand each block to the parsers as it arrives; a full queue
+            # pauses the download until the workers catch up
+            csv_header = None
+            async for block in self._iter_text_blocks(stream):
+                if log_type == "performance":
+                    # Every CSV block needs the header row for column names
+                    if csv_header is None:
+                        csv_header, _, block = block.partition("\n")
+                    block = f"{csv_header}\n{block}"
+                await queue.put((block, blob_date, log_type))
 
-    def _parse_performance_data(self, content: str, log_date: datetime.date) -> None:
+    @staticmethod
+    async def _iter_text_blocks(stream):
         """
-        Parse performance CSV data
+        Yield line-aligned text blocks decoded incrementally from a blob stream
         """
-        # This will be moved to LogParser module
-        pass
+        decoder = codecs.getincrementaldecoder("utf-8")()
+        pending = ""
+
+        async for chunk in stream.chunks():
+            text = pending + decoder.decode(chunk)
+            cut = text.rfind("\n") + 1
+            if cut:
+                yield text[:cut]
+            pending = text[cut:]
+
+        pending += decoder.decode(b"", final=True)
+        if pending:
+            yield pending
@@ -7,28 +7,121 @@ Handles parsing of system logs and performance data.
 """
 
 import logging
-import csv
 from datetime import datetime
 from io import StringIO
-from typing import Dict, List, Any
+from typing import List, NamedTuple, Optional, Tuple, Union
 import re
+import sys
+
+import pandas as pd
 
 logger = logging.getLogger(__name__)
 
+# Syslog format: timestamp hostname process[pid]: message
+# Whitespace before the colon is only allowed after "[pid]"; the process group
+# already absorbs it otherwise, and a second optional "\s*" there made the
+# engine backtrack quadratically on long malformed lines.
+_SYSLOG_RE = re.compile(
+    r"^(\w{3}\s+\d{1,2}\s+\d{2}:\d{2}:\d{2})\s+(\S+)\s+([^:\[]+)(?:\[(\d+)\]\s*)?:\s*(.*)$"
+)
+
+# Syslog month abbreviations
+_MONTHS = {
+    "Jan": 1,
+    "Feb": 2,
+    "Mar": 3,
+    "Apr": 4,
+    "May": 5,
+    "Jun": 6,
+    "Jul": 7,
+    "Aug": 8,
+    "Sep": 9,
+    "Oct": 10,
+    "Nov": 11,
+    "Dec": 12,
+}
+
+# Log levels in priority order; "err" also matches "error", "warn" matches
+# "warning" and "info" matches "information"
+_LOG_LEVEL_KEYWORDS = (
+    ("ERROR", ("err",)),
+    ("WARNING", ("warn",)),
+    ("INFO", ("info",)),
+    ("DEBUG", ("debug",)),
+)
+
+# Event categories in priority order, matched against the lowercased message
+_EVENT_KEYWORDS = (
+    ("FAILOVER", ("failover", "switching", "route change", "metric")),
+    ("REBOOT", ("reboot", "restart", "startup", "shutdown")),
+    ("NETWORK", ("network", "interface", "connection", "link")),
+    ("GPS", ("gps", "location", "coordinate")),
+    ("STARLINK", ("starlink", "dishy", "satellite")),
+)
+_SYSTEM_PROCESS_KEYWORDS = ("kernel", "systemd", "cron")
+
+# Numeric performance CSV columns, parsed as float64. These values end up in
+# the statistics and the JSON report, where float32 would show up as noise
+# (59.1 as 59.099998)
+_PERFORMANCE_METRICS = (
+    "ping_latency_ms",
+    "packet_loss_pct",
+    "downlink_throughput_bps",
+    "uplink_throughput_bps",
+    "speed_kmh",
+    "latitude",
+    "longitude",
+)
+
+# The only metrics a sample may leave empty; rows missing any other are
+# skipped, as the csv.DictReader parser's float("") failures skipped them
+_OPTIONAL_METRICS = ("latitude", "longitude")
+
+
+class LogEntry(NamedTuple):
+    """A parsed syslog line (a tuple, so far smaller than a per-line dict)"""
+
+    timestamp: datetime
+    hostname: str
+    process: str
+    pid: Optional[int]
+    message: str
+    log_level: str
+    event_type: str
+
+
+def _contains_any(text: str, keywords: Tuple[str, ...]) -> bool:
+    """Return True if any keyword is a substring of text"""
+    for keyword in keywords:
+        if keyword in text:
+            return True
+    return False
+
+
+def _parse_chunk(chunk: str, log_date: datetime.date) -> List[LogEntry]:
+    """Parse a block of syslog lines (module level so it can run in a worker)"""
+    parser = LogParser()
+    entries = []
+
+    for line in chunk.split("\n"):
+        if not line.strip():
+            continue
+
+        entry = parser._parse_log_line(line, log_date)
+        if entry:
+            entries.append(entry)
+
+    return entries
+
 
 class LogParser:
     """
     Parses various log formats and extracts structured data
     """
 
-    def __init__(self):
-        """Initialize the log parser"""
-        self.system_logs = []
-        self.performance_data = []
-
     def parse_system_logs(
         self, content: str, log_date: datetime.date
-    ) -> List[Dict[str, Any]]:
+    ) -> List[LogEntry]:
         """
         Parse system log content and extract relevant events
 
@@ -39,25 +132,17 @@ class LogParser:
         Returns:
             List of parsed log entries
         """
-        entries = []
-
+        # Already called on bounded blocks from the downloader's worker
+        # processes, so the block is parsed in place
         try:
-            for line in content.split("\n"):
-                if not line.strip():
-                    continue
-
-                entry = self._parse_log_line(line, log_date)
-                if entry:
-                    entries.append(entry)
-
+            return _parse_chunk(content, log_date)
         except Exception as e:
-            logger.error(f"Error parsing system logs for {log_date}: {e}")
-
-        return entries
+            logger.error("Error parsing system logs for %s: %s", log_date, e)
+            return []
 
     def parse_performance_data(
         self, content: str, log_date: datetime.date
-    ) -> List[Dict[str, Any]]:
+    ) -> pd.DataFrame:
         """
         Parse performance CSV data
 
@@ -66,142 +151,107 @@ class LogParser:
             log_date: Date of the data file
 
         Returns:
-            List of parsed performance entries
+            DataFrame of parsed performance entries, one row per sample
         """
-        entries = []
-
         try:
-            csv_reader = csv.DictReader(StringIO(content))
-
-            for row in csv_reader:
-                entry = self._parse_csv_row(row, log_date)
-                if entry:
-                    entries.append(entry)
+            # Expected CSV columns: timestamp,ping_latency_ms,packet_loss_pct,downlink_throughput_bps,uplink_throughput_bps,speed_kmh,latitude,longitude
+            df = pd.read_csv(StringIO(content), na_values=[""], engine="c")
+
+            # Metrics are coerced column by column so that one malformed or
+            # empty cell only costs its own row; only coordinates may be empty
+            metrics = [column for column in _PERFORMANCE_METRICS if column in df]
+            invalid = pd.Series(False, index=df.index)
+            for column in metrics:
+                values = pd.to_numeric(df[column], errors="coerce")
+                missing = values.isna()
+                if column in _OPTIONAL_METRICS:
+                    missing &= df[column].notna()
+                invalid |= missing
+                df[column] = values.astype("float64")
+
+            if invalid.any():
+                logger.warning(
+                    "Skipping %d performance rows with empty or unparseable "
+                    "values for %s",
+                    invalid.sum(),
+                    log_date,
+                )
+                df = df[~invalid]
+
+            # Rows with unparseable timestamps are dropped, as before
+            df["timestamp"] = pd.to_datetime(
+                df["timestamp"], format="ISO8601", errors="coerce"
+            )
+            return df.dropna(subset=["timestamp"])
 
         except Exception as e:
-            logger.error(f"Error parsing performance data for {log_date}: {e}")
-
-        return entries
+            logger.error("Error parsing performance data for %s: %s", log_date, e)
+            return pd.DataFrame()
 
-    def _parse_log_line(self, line: str, log_date: datetime.date) -> Dict[str, Any]:
+    def _parse_log_line(self, line: str, log_date: datetime.date) -> Optional[LogEntry]:
         """
         Parse a single log line into structured data
         """
-        # Syslog format: timestamp hostname process[pid]: message
-        syslog_pattern = r"^(\w{3}\s+\d{1,2}\s+\d{2}:\d{2}:\d{2})\s+(\S+)\s+([^:\[]+)(?:\[(\d+)\])?\s*:\s*(.*)$"
-
-        match = re.match(syslog_pattern, line)
+        match = _SYSLOG_RE.match(line)
         if not match:
             return None
 
         timestamp_str, hostname, process, pid, message = match.groups()
 
-        # Convert timestamp
+        # Convert timestamp; the regex already fixed its shape, so skip strptime
         try:
-            timestamp = datetime.strptime(
-                f"{log_date.year} {timestamp_str}", "%Y %b %d %H:%M:%S"
+            month, day, clock = timestamp_str.split()
+            hour, minute, second = clock.split(":")
+            timestamp = datetime(
+                log_date.year,
+                _MONTHS[month],
+                int(day),
+                int(hour),
+                int(minute),
+                int(second),
             )
-        except ValueError:
+        except (KeyError, ValueError):
             timestamp = datetime.combine(log_date, datetime.min.time())
 
-        return {
-            "timestamp": timestamp,
-            "hostname": hostname,
-            "process": process,
-            "pid": int(pid) if pid else None,
-            "message": message.strip(),
-            "log_level": self._extract_log_level(message),
-            "event_type": self._classify_event(process, message),
-        }
-
-    def _parse_csv_row(
-        self, row: Dict[str, str], log_date: datetime.date
-    ) -> Dict[str, Any]:
-        """
-        Parse a CSV row into structured performance data
-        """
-        try:
-            # Expected CSV columns: timestamp,ping_latency_ms,packet_loss_pct,downlink_throughput_bps,uplink_throughput_bps,speed_kmh,latitude,longitude
-            return {
-                "timestamp": datetime.fromisoformat(row.get("timestamp", "")),
-                "ping_latency_ms": float(row.get("ping_latency_ms", 0)),
-                "packet_loss_pct": float(row.get("packet_loss_pct", 0)),
-                "downlink_throughput_bps": float(row.get("downlink_throughput_bps", 0)),
-                "uplink_throughput_bps": float(row.get("uplink_throughput_bps", 0)),
-                "speed_kmh": float(row.get("speed_kmh", 0)),
-                "latitude": (
-                    float(row.get("latitude", 0)) if row.get("latitude") else None
-                ),
-                "longitude": (
-                    float(row.get("longitude", 0)) if row.get("longitude") else None
-                ),
-            }
-        except (ValueError, TypeError) as e:
-            logger.warning(f"Error parsing CSV row: {e}")
-            return None
+        log_level, event_type = self._classify(process, message)
+
+        # Hostnames and process names repeat on nearly every line, so share one
+        # string object per distinct value instead of one per entry
+        return LogEntry(
+            timestamp=timestamp,
+            hostname=sys.intern(hostname),
+            process=sys.intern(process),
+            pid=int(pid) if pid else None,
+            message=message.strip(),
+            log_level=log_level,
+            event_type=event_type,
+        )
+
+    def _classify(self, process: str, message: str) -> Tuple[str, str]:
+        """Extract log level and event type with one lowercase copy of the message"""
+        message_lower = message.lower()
 
-    def _extract_log_level(self, message: str) -> str:
-        """Extract log level from message"""
-        message_upper = message.upper()
-
-        if any(level in message_upper for level in ["ERROR", "ERR"]):
-            return "ERROR"
-        elif any(level in message_upper for level in ["WARN", "WARNING"]):
-            return "WARNING"
-        elif any(level in message_upper for level in ["INFO", "INFORMATION"]):
-            return "INFO"
-        elif any(level in message_upper for level in ["DEBUG"]):
-            return "DEBUG"
-        else:
-            return "UNKNOWN"
+        # Plain substring tests on purpose: keywords overlap ("link" inside
+        # "starlink"), which a single alternation regex would consume in one
+        # non-overlapping match, and the few C-level scans are no slower
+        log_level = "UNKNOWN"
+        for level, keywords in _LOG_LEVEL_KEYWORDS:
+            if _contains_any(message_lower, keywords):
+                log_level = level
+                break
 
-    def _classify_event(self, process: str, message: str) -> str:
-        """Classify the type of event based on process and message"""
-        message_lower = message.lower()
-        process_lower = process.lower()
-
-        # Failover events
-        if any(
-            keyword in message_lower
-            for keyword in ["failover", "switching", "route change", "metric"]
-        ):
-            return "FAILOVER"
-
-        # Reboot events
-        if any(
-            keyword in message_lower
-            for keyword in ["reboot", "restart", "startup", "shutdown"]
-        ):
-            return "REBOOT"
-
-        # Network events
-        if any(
-            keyword in message_lower
-            for keyword in ["network", "interface", "connection", "link"]
-        ):
-            return "NETWORK"
-
-        # GPS events
-        if any(
-            keyword in message_lower for keyword in ["gps", "location", "coordinate"]
-        ):
-            return "GPS"
-
-        # Starlink specific
-        if any(
-            keyword in message_lower for keyword in ["starlink", "dishy", "satellite"]
-        ):
-            return "STARLINK"
-
-        # System events
-        if any(keyword in process_lower for keyword in ["kernel", "systemd", "cron"]):
-            return "SYSTEM"
-
-        return "OTHER"
+        for category, keywords in _EVENT_KEYWORDS:
+            if _contains_any(message_lower, keywords):
+                return log_level, category
+
+        if _contains_any(process.lower(), _SYSTEM_PROCESS_KEYWORDS):
+            return log_level, "SYSTEM"
+
+        return log_level, "OTHER"
 
     def parse_log_content(
         self, content: str, log_date: datetime.date
-    ) -> List[Dict[str, Any]]:
+    ) -> Union[List[LogEntry], pd.DataFrame]:
         """
         Parse log content and return structured data
 
@@ -210,7 +260,7 @@ class LogParser:
             log_date: Date of the log file
 
         Returns:
-            List of parsed log entries
+            List of parsed log entries, or a DataFrame for performance CSVs
         """
         # Determine content type and delegate to appropriate parser
         if content.strip().startswith("timestamp,") or "," in content:
@@ -7,20 +7,51 @@ This module orchestrates the complete network analysis workflow,
 coordinating data downloading, parsing, analysis, and visualization.
 """
 
-from typing import Dict, List, Any, Optional
+from typing import Dict, List, Any, Optional, Tuple
 import argparse
+import os
 import sys
 from datetime import datetime, timedelta
 
+import orjson
+import pandas as pd
+
 from .data_downloader import DataDownloader
 from .log_parser import LogParser
 from .performance_analyzer import PerformanceAnalyzer
-from .visualizer import Visualizer
+
+# Fixed parts of the printed summary
+SUMMARY_RULE = "=" * 60
+SUMMARY_TITLE = "📊 NETWORK ANALYSIS SUMMARY"
+
+# orjson handles datetimes, NumPy arrays and scalars natively
+REPORT_JSON_OPTIONS = (
+    orjson.OPT_INDENT_2 | orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_NAIVE_UTC
+)
+
+
+def _json_default(obj: Any) -> Any:
+    """Serialize values orjson does not know (pandas timestamps, NaT)"""
+    if obj is pd.NaT:
+        return None
+    if hasattr(obj, "isoformat"):
+        return obj.isoformat()
+    return str(obj)
 
 
 class NetworkAnalyzer:
     """Main orchestrator for network analysis workflow"""
 
+    __slots__ = (
+        "storage_account",
+        "container_name",
+        "downloader",
+        "parser",
+        "analyzer",
+        "_visualizer",
+        "_analysis_cache",
+    )
+
     def __init__(self, storage_account: str, container_name: str = "logs"):
         self.storage_account = storage_account
         self.container_name = container_name
@@ -29,7 +60,38 @@ class NetworkAnalyzer:
         self.downloader = DataDownloader(storage_account)
         self.parser = LogParser()
         self.analyzer = PerformanceAnalyzer()
-        self.visualizer = Visualizer()
+        # Created on first use, so runs without charts never import matplotlib
+        self._visualizer = None
+
+        # (performance_data, (stats, patterns, insights)) of the last analysis
+        self._analysis_cache = None
+
+    def close(self) -> None:
+        """
+        Release the downloader's pooled Azure connections and the chart figures
+
+        The connections stay open between run_analysis and generate_report
+        calls so later downloads reuse them; call this (or use the analyzer
+        as a context manager) once done.
+        """
+        self.downloader.close()
+        if self._visualizer is not None:
+            self._visualizer.close()
+
+    def __enter__(self) -> "NetworkAnalyzer":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+    @property
+    def visualizer(self):
+        """Chart renderer, imported and created when charts are first drawn"""
+        if self._visualizer is None:
+            from .visualizer import Visualizer
+
+            self._visualizer = Visualizer()
+        return self._visualizer
 
     def run_analysis(
         self,
@@ -46,7 +108,8 @@ class NetworkAnalyzer:
         start_date = end_date - timedelta(days=days)
 
         self.downloader.download_data(days)
-        if not self.downloader.system_logs and not self.downloader.performance_data:
+
+        if not self.downloader.system_logs and self.downloader.performance_data.empty:
             print("❌ No data found for the specified period")
             return {}
 
@@ -64,17 +127,19 @@ class NetworkAnalyzer:
 
         # Step 3: Analyze data
         print("📊 Analyzing performance metrics...")
-        stats = self.analyzer.calculate_statistics(performance_data)
-        patterns = self.analyzer.identify_patterns(performance_data)
-        insights = self.analyzer.generate_insights(stats)
+        stats, patterns, insights = self._analyze(performance_data)
 
         # Step 4: Generate visualizations if requested
         charts = {}
         if generate_visualizations:
             print("📈 Generating visualizations...")
-            charts = self.visualizer.create_all_charts(
-                performance_data, stats, output_dir
-            )
+            try:
+                charts = self.visualizer.create_all_charts(
+                    performance_data, stats, output_dir
+                )
+            finally:
+                # Free the chart figures even if drawing fails midway
+                self.visualizer.close()
             print(f"✅ Generated {len(charts)} visualization charts")
 
         # Compile results
@@ -99,6 +164,21 @@ class NetworkAnalyzer:
         print("🎉 Analysis completed successfully!")
         return results
 
+    def _analyze(
+        self, performance_data
+    ) -> Tuple[Dict[str, Any], Dict[str, Any], List[str]]:
+        """Analyze performance data, reusing the last result for the same data"""
+        cache = self._analysis_cache
+        if cache is not None and cache[0] is performance_data:
+            return cache[1]
+
+        stats = self.analyzer.calculate_statistics(performance_data)
+        patterns = self.analyzer.identify_patterns(performance_data)
+        insights = self.analyzer.generate_insights(stats)
+
+        self._analysis_cache = (performance_data, (stats, patterns, insights))
+        return stats, patterns, insights
+
     def download_data(self, days_back: int = 7) -> None:
         """Download data from Azure Storage for the specified number of days"""
         print(f"📥 Downloading data for the last {days_back} days...")
@@ -124,10 +204,8 @@ class NetworkAnalyzer:
             performance_data = []
 
         # Analyze the data
-        if performance_data:
-            stats = self.analyzer.calculate_statistics(performance_data)
-            patterns = self.analyzer.identify_patterns(performance_data)
-            insights = self.analyzer.generate_insights(performance_data)
+        if len(performance_data):
+            stats, patterns, insights = self._analyze(performance_data)
         else:
             stats = {}
             patterns = []
@@ -147,6 +225,19 @@ class NetworkAnalyzer:
 
         return report
 
+    def save_report(self, report: Dict[str, Any], output_file: str) -> None:
+        """Write an analysis report or results dict to a JSON file"""
+        output_dir = os.path.dirname(output_file)
+        if output_dir:
+            os.makedirs(output_dir, exist_ok=True)
+
+        with open(output_file, "wb") as f:
+            f.write(
+                orjson.dumps(report, default=_json_default, option=REPORT_JSON_OPTIONS)
+            )
+
+        print(f"💾 Report saved to {output_file}")
+
     def create_visualizations(self, output_dir: str = "./charts") -> None:
         """Create visualization charts"""
         print(f"📈 Creating visualizations in {output_dir}...")
@@ -158,7 +249,7 @@ class NetworkAnalyzer:
             print("⚠️ No performance data available for visualizations")
             return
 
-        if not performance_data:
+        if len(performance_data) == 0:
             print("⚠️ No performance data to visualize")
             return
 
@@ -171,37 +262,43 @@ class NetworkAnalyzer:
 
     def print_summary(self, results: Dict[str, Any]) -> None:
         """Print a summary of analysis results"""
-        print("\n" + "=" * 60)
-        print("📊 NETWORK ANALYSIS SUMMARY")
-        print("=" * 60)
+        # Collect the lines and emit them with a single write
+        out = ["", SUMMARY_RULE, SUMMARY_TITLE, SUMMARY_RULE]
 
         if "analysis_period" in results:
             period = results["analysis_period"]
-            print(f"📅 Analysis Period: {period.get('days_analyzed', 'Unknown')} days")
-            print(f"📝 System Logs: {period.get('total_system_logs', 0):,}")
-            print(
+            out.append(
+                f"📅 Analysis Period: {period.get('days_analyzed', 'Unknown')} days"
+            )
+            out.append(f"📝 System Logs: {period.get('total_system_logs', 0):,}")
+            out.append(
                 f"📈 Performance Data Points: {period.get('total_performance_data', 0):,}"
             )
 
         if "statistics" in results and results["statistics"]:
-            print(f"\n📊 Performance Statistics:")
+            out.append("")
+            out.append("📊 Performance Statistics:")
             stats = results["statistics"]
             if "latency" in stats:
                 lat = stats["latency"]
-                print(
+                out.append(
                     f"   • Latency: avg={lat.get('mean', 0):.1f}ms, "
                     f"min={lat.get('min', 0):.1f}ms, max={lat.get('max', 0):.1f}ms"
                 )
             if "throughput" in stats:
                 tput = stats["throughput"]
-                print(f"   • Throughput: avg={tput.get('mean', 0):.1f} Mbps")
+                out.append(f"   • Throughput: avg={tput.get('mean', 0):.1f} Mbps")
 
         if "insights" in results and results["insights"]:
-            print(f"\n🔍 Key Insights ({len(results['insights'])} found):")
+            out.append("")
+            out.append(f"🔍 Key Insights ({len(results['insights'])} found):")
             for i, insight in enumerate(results["insights"][:3], 1):  # Show top 3
-                print(f"   {i}. {insight}")
+                out.append(f"   {i}. {insight}")
+
+        out.append("")
+        out.append(SUMMARY_RULE)
 
-        print("\n" + "=" * 60)
+        sys.stdout.write("\n".join(out) + "\n")
 
 
 def main():
@@ -226,20 +323,31 @@ def main():
         default="./analysis_output",
         help="Output directory for charts and reports",
     )
+    parser.add_argument(
+        "--save-report",
+        action="store_true",
+        help="Also write the results to network_analysis_report.json in --output-dir",
+    )
 
     args = parser.parse_args()
 
     try:
         # Create analyzer and run analysis
-        analyzer = NetworkAnalyzer(args.storage_account, args.container)
-        results = analyzer.run_analysis(
-            days=args.days,
-            generate_visualizations=args.visualizations,
-            output_dir=args.output_dir,
-        )
+        with NetworkAnalyzer(args.storage_account, args.container) as analyzer:
+            results = analyzer.run_analysis(
+                days=args.days,
+                generate_visualizations=args.visualizations,
+                output_dir=args.output_dir,
+            )
 
-        # Print summary
-        analyzer.print_summary(results)
+            # Print summary
+            analyzer.print_summary(results)
+
+            if results and args.save_report:
+                analyzer.save_report(
+                    results,
+                    os.path.join(args.output_dir, "network_analysis_report.json"),
+                )
 
         return 0
 
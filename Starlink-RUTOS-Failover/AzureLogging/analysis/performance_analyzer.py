@@ -7,23 +7,125 @@ This module provides performance analysis capabilities for network data.
 It calculates statistics, identifies patterns, and generates insights.
 """
 
-from typing import Dict, List, Any, Optional
+from typing import Dict, List, Any, Optional, Union
+import operator
 import pandas as pd
 import numpy as np
 
 
+def _as_frame(data: Union[List[Dict[str, Any]], pd.DataFrame]) -> pd.DataFrame:
+    """Return data as a DataFrame without copying one that already is"""
+    return data if isinstance(data, pd.DataFrame) else pd.DataFrame(data)
+
+
+def _column_array(df: pd.DataFrame, column: str) -> np.ndarray:
+    """Return a column as a float64 array with missing values as NaN"""
+    return df[column].to_numpy(dtype=np.float64, na_value=np.nan)
+
+
+def _column_values(df: pd.DataFrame, column: str) -> np.ndarray:
+    """Return the non-missing values of a column as a float64 array"""
+    values = _column_array(df, column)
+    return values[~np.isnan(values)]
+
+
+def _records(df: pd.DataFrame, mask: np.ndarray) -> List[Dict[str, Any]]:
+    """Return the rows selected by a boolean array as record dicts"""
+    rows = np.flatnonzero(mask)
+    return df.iloc[rows].to_dict("records") if rows.size else []
+
+
+def _mean(values: np.ndarray) -> float:
+    """Mean of a NumPy array, NaN when it is empty"""
+    return float(values.mean()) if values.size else np.nan
+
+
+_SUMMARY_KEYS = ("mean", "median", "std", "min", "max")
+
+# Columns summarized by calculate_statistics
+_STATISTIC_COLUMNS = (
+    "ping_latency_ms",
+    "packet_loss_pct",
+    "downlink_throughput_bps",
+    "uplink_throughput_bps",
+)
+
+# (stats group, key, comparison, threshold, message) for generate_insights
+_INSIGHT_RULES = (
+    ("ping_stats", "mean", operator.gt, 100, "High average latency detected (>100ms)"),
+    ("ping_stats", "std", operator.gt, 50, "High latency variability detected"),
+    (
+        "packet_loss_stats",
+        "mean",
+        operator.gt,
+        1.0,
+        "Significant packet loss detected (>1%)",
+    ),
+    (
+        "throughput_stats",
+        "downlink_mean_mbps",
+        operator.lt,
+        10,
+        "Low average throughput detected (<10 Mbps)",
+    ),
+)
+
+
+def _summarize(values: np.ndarray) -> Dict[str, float]:
+    """Mean, median, sample std, min and max of a NumPy array"""
+    if values.size == 0:
+        return dict.fromkeys(_SUMMARY_KEYS, np.nan)
+
+    return {
+        "mean": _mean(values),
+        "median": float(np.median(values)),
+        "std": float(values.std(ddof=1)) if values.size > 1 else np.nan,
+        "min": float(values.min()),
+        "max": float(values.max()),
+    }
+
+
+def _summarize_columns(df: pd.DataFrame, columns) -> Dict[str, Dict[str, float]]:
+    """Summaries of the present columns, reduced together as one 2-D array"""
+    columns = [column for column in columns if column in df.columns]
+    if not columns:
+        return {}
+
+    # One row per column, contiguous so each reduction runs along a row
+    block = np.ascontiguousarray(
+        df[columns].to_numpy(dtype=np.float64, na_value=np.nan).T
+    )
+    if block.shape[1] < 2 or np.isnan(block).any():
+        # Columns with gaps are reduced one by one over their own values
+        return {column: _summarize(_column_values(df, column)) for column in columns}
+
+    reductions = (
+        block.mean(axis=1),
+        np.median(block, axis=1),
+        block.std(axis=1, ddof=1),
+        block.min(axis=1),
+        block.max(axis=1),
+    )
+    return {
+        column: dict(zip(_SUMMARY_KEYS, map(float, values)))
+        for column, values in zip(columns, zip(*reductions))
+    }
+
+
 class PerformanceAnalyzer:
     """Analyzes performance metrics and calculates statistics"""
 
     def __init__(self):
         self.stats = {}
 
-    def calculate_statistics(self, data: List[Dict[str, Any]]) -> Dict[str, Any]:
+    def calculate_statistics(
+        self, data: Union[List[Dict[str, Any]], pd.DataFrame]
+    ) -> Dict[str, Any]:
         """Calculate comprehensive performance statistics"""
-        if not data:
+        if data is None or len(data) == 0:
             return {}
 
-        df = pd.DataFrame(data)
+        df = _as_frame(data)
 
         stats = {
             "total_records": len(df),
@@ -33,38 +135,37 @@ class PerformanceAnalyzer:
             },
         }
 
-        # Network performance stats
-        if "ping_latency_ms" in df.columns:
-            stats["ping_stats"] = {
-                "mean": df["ping_latency_ms"].mean(),
-                "median": df["ping_latency_ms"].median(),
-                "std": df["ping_latency_ms"].std(),
-                "min": df["ping_latency_ms"].min(),
-                "max": df["ping_latency_ms"].max(),
-            }
+        # Network performance stats, reduced over NumPy arrays (float32
+        # columns are widened so the sums keep full precision)
+        summaries = _summarize_columns(df, _STATISTIC_COLUMNS)
 
-        if "packet_loss_pct" in df.columns:
+        if "ping_latency_ms" in summaries:
+            stats["ping_stats"] = summaries["ping_latency_ms"]
+
+        if "packet_loss_pct" in summaries:
+            loss = summaries["packet_loss_pct"]
             stats["packet_loss_stats"] = {
-                "mean": df["packet_loss_pct"].mean(),
-                "median": df["packet_loss_pct"].median(),
-                "max": df["packet_loss_pct"].max(),
+                key: loss[key] for key in ("mean", "median", "max")
             }
 
-        if "downlink_throughput_bps" in df.columns:
+        if "downlink_throughput_bps" in summaries:
             stats["throughput_stats"] = {
-                "downlink_mean_mbps": df["downlink_throughput_bps"].mean() / 1_000_000,
+                "downlink_mean_mbps": summaries["downlink_throughput_bps"]["mean"]
+                / 1_000_000,
                 "uplink_mean_mbps": (
-                    df["uplink_throughput_bps"].mean() / 1_000_000
-                    if "uplink_throughput_bps" in df
+                    summaries["uplink_throughput_bps"]["mean"] / 1_000_000
+                    if "uplink_throughput_bps" in summaries
                     else 0
                 ),
             }
 
         return stats
 
-    def identify_patterns(self, data: List[Dict[str, Any]]) -> Dict[str, Any]:
+    def identify_patterns(
+        self, data: Union[List[Dict[str, Any]], pd.DataFrame]
+    ) -> Dict[str, Any]:
         """Identify patterns in performance data"""
-        if not data:
+        if data is None or len(data) == 0:
             return {}
 
         patterns = {
@@ -74,17 +175,23 @@ class PerformanceAnalyzer:
         }
 
         # Analyze for patterns
-        df = pd.DataFrame(data)
+        df = _as_frame(data)
 
+        # Thresholds are compared on NumPy arrays (NaN never exceeds one) and
+        # only the selected rows are turned into dicts for the report
         if "ping_latency_ms" in df.columns:
-            high_latency_threshold = df["ping_latency_ms"].quantile(0.95)
-            patterns["high_latency_events"] = df[
-                df["ping_latency_ms"] > high_latency_threshold
-            ].to_dict("records")
+            latency = _column_array(df, "ping_latency_ms")
+            present = latency[~np.isnan(latency)]
+            high_latency_threshold = (
+                np.quantile(present, 0.95) if present.size else np.nan
+            )
+            patterns["high_latency_events"] = _records(
+                df, latency > high_latency_threshold
+            )
 
         if "packet_loss_pct" in df.columns:
-            patterns["packet_loss_events"] = df[df["packet_loss_pct"] > 1.0].to_dict(
-                "records"
+            patterns["packet_loss_events"] = _records(
+                df, _column_array(df, "packet_loss_pct") > 1.0
             )
 
         return patterns
@@ -93,21 +200,9 @@ class PerformanceAnalyzer:
         """Generate human-readable insights from statistics"""
         insights = []
 
-        if "ping_stats" in stats:
-            ping_stats = stats["ping_stats"]
-            if ping_stats["mean"] > 100:
-                insights.append("High average latency detected (>100ms)")
-            if ping_stats["std"] > 50:
-                insights.append("High latency variability detected")
-
-        if "packet_loss_stats" in stats:
-            loss_stats = stats["packet_loss_stats"]
-            if loss_stats["mean"] > 1.0:
-                insights.append("Significant packet loss detected (>1%)")
-
-        if "throughput_stats" in stats:
-            throughput = stats["throughput_stats"]
-            if throughput["downlink_mean_mbps"] < 10:
-                insights.append("Low average throughput detected (<10 Mbps)")
+        for group, key, compare, threshold, message in _INSIGHT_RULES:
+            values = stats.get(group)
+            if values and compare(values[key], threshold):
+                insights.append(message)
 
         return insights
@@ -7,244 +7,638 @@ This module provides visualization capabilities for network analysis data.
 It creates charts, graphs, and visual representations of performance metrics.
 """
 
-from typing import Dict, List, Any, Optional
-import matplotlib.pyplot as plt
-import seaborn as sns
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from typing import Dict, List, Any, Optional, Tuple, Union
+import numpy as np
 import pandas as pd
 from datetime import datetime
+from pathlib import Path
 import io
 import base64
+import matplotlib
+
+# Charts are only ever written to files or buffers; skip GUI backends
+matplotlib.use("Agg")
+
+import matplotlib.pyplot as plt  # noqa: E402
+from matplotlib.figure import Figure  # noqa: E402
+
+# seaborn's six-color "husl" palette, inlined so that seaborn is not imported
+# just to set the color cycle
+HUSL_PALETTE = (
+    "#f77189",
+    "#bb9832",
+    "#50b131",
+    "#36ada4",
+    "#3ba3ec",
+    "#e866f4",
+)
+
+# Set style for consistent plotting, once per process
+plt.style.use("default")
+matplotlib.rcParams["axes.prop_cycle"] = matplotlib.cycler(color=HUSL_PALETTE)
+
+# Chart input: row records, or column-oriented data (a DataFrame or a NumPy
+# structured array) that the charts read without any conversion
+ChartData = Union[List[Dict[str, Any]], pd.DataFrame, np.ndarray]
+
+# Chart resolution; 100 dpi suits screens and dashboards and rasterizes
+# ~9x fewer pixels than 300 dpi
+DEFAULT_DPI = 100
+
+# Pillow PNG encoder settings. zlib level 1 instead of the default 6 makes
+# chart PNGs roughly 30% larger but cuts encode time, which is most of the
+# save cost for these mostly flat images; optimize would add an extra
+# compression pass on top, so it stays off.
+PNG_PIL_KWARGS = {"compress_level": 1, "optimize": False}
+
+# Output formats charts can be saved in. SVG skips rasterization entirely,
+# so it is much cheaper to emit and suits charts embedded in HTML
+IMAGE_FORMATS = ("png", "svg")
+
+# Line charts keep at most this many points; a 12in figure at 100 dpi is only
+# ~1200 pixels wide, so longer series just overdraw the same columns. With
+# series this short a plain Line2D draws as fast as a LineCollection would,
+# and chart time goes to Agg rasterization and PNG encoding instead.
+MAX_PLOT_POINTS = 4000
+
+# Figure margins that tight_layout adjusts and reused figures must reset
+_SUBPLOT_PARAMS = ("left", "right", "bottom", "top", "wspace", "hspace")
+
+# Visualizer method drawing each chart kind of create_all_charts
+_CHART_METHODS = {
+    "latency": "create_latency_chart",
+    "throughput": "create_throughput_chart",
+    "packet_loss": "create_packet_loss_chart",
+    "summary": "create_statistics_summary",
+}
+
+# Upper bound on threads used to flush batched chart files to disk
+MAX_WRITE_WORKERS = 8
+
+
+def _savefig(fig, target, dpi: int, image_format: str = "png") -> None:
+    """Save a figure as PNG or SVG to a path or buffer"""
+    if image_format == "svg":
+        # Vector output: there is no raster resolution or encoder to configure
+        fig.savefig(target, format="svg", bbox_inches="tight")
+        return
+
+    fig.savefig(
+        target,
+        format="png",
+        dpi=dpi,
+        bbox_inches="tight",
+        pil_kwargs=PNG_PIL_KWARGS,
+    )
+
+
+def _has_columns(data: ChartData, *names: str) -> bool:
+    """
+    Check for columns on a DataFrame or structured array, or on the first
+    of a list of records
+    """
+    if isinstance(data, pd.DataFrame):
+        keys = data.columns
+    elif isinstance(data, np.ndarray):
+        keys = data.dtype.names or ()
+    else:
+        keys = data[0]
+    return all(name in keys for name in names)
+
+
+def _timestamps(values: np.ndarray) -> np.ndarray:
+    """
+    Return timestamps as a naive UTC datetime64 array
+
+    Strings (e.g. from JSON logs) and datetime objects are parsed once here,
+    with repeated values parsed only once, instead of matplotlib converting
+    every point on its own.
+    """
+    if values.dtype.kind == "M":
+        return values
+
+    parsed = pd.to_datetime(values, utc=True, format="ISO8601", cache=True)
+    return parsed.tz_localize(None).to_numpy()
+
+
+def _columns(data: ChartData, *names: str) -> Optional[List[np.ndarray]]:
+    """
+    Extract the named columns as NumPy arrays, or None if any is missing
+
+    DataFrame and structured array columns are used as they are, apart from
+    timestamps that still need parsing. Records
+    are read straight into arrays rather than through a DataFrame, so a
+    chart only pays for the columns it plots.
+    """
+    if not _has_columns(data, *names):
+        return None
+
+    if isinstance(data, pd.DataFrame):
+        columns = [data[name].to_numpy() for name in names]
+    elif isinstance(data, np.ndarray):
+        columns = [data[name] for name in names]
+    else:
+        columns = [
+            np.array(
+                [record.get(name) for record in data],
+                dtype=object if name == "timestamp" else np.float64,
+            )
+            for name in names
+        ]
+
+    return [
+        _timestamps(column) if name == "timestamp" else column
+        for name, column in zip(names, columns)
+    ]
+
+
+def _mbps(bps: np.ndarray) -> np.ndarray:
+    """Convert a bits-per-second array to Mbps in one ufunc pass"""
+    return np.asarray(bps, dtype=np.float64) * 1e-6
+
+
+def _decimate(
+    x: np.ndarray, y: np.ndarray, max_points: int = MAX_PLOT_POINTS
+) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Thin a series to about max_points samples for plotting
+
+    The series is cut into max_points / 2 equal buckets and the minimum and
+    maximum of each are kept, so spikes survive unlike with a plain stride.
+    analyze-network-performance.py carries a copy; keep the two in step.
+    """
+    n = len(y)
+    if n <= max_points:
+        return x, y
+
+    buckets = max_points // 2
+    size = -(-n // buckets)
+    values = np.full(buckets * size, np.nan)
+    values[:n] = y
+    values = values.reshape(buckets, size)
+
+    # NaNs (gaps and padding) must never win the min/max
+    missing = np.isnan(values)
+    lowest = np.where(missing, np.inf, values).argmin(axis=1)
+    highest = np.where(missing, -np.inf, values).argmax(axis=1)
+
+    starts = np.arange(buckets) * size
+    keep = np.unique(np.concatenate((starts + lowest, starts + highest)))
+    keep = keep[keep < n]
+    return x[keep], y[keep]
+
+
+def _draw_latency(ax, timestamps: np.ndarray, latency: np.ndarray) -> None:
+    """Draw latency over time onto ax"""
+    # Rotate the date labels up front; rotating afterwards re-lays out ticks
+    ax.tick_params(axis="x", labelrotation=45)
+    ax.plot(
+        *_decimate(timestamps, latency),
+        linewidth=1,
+        alpha=0.7,
+        label="Ping Latency",
+    )
+    ax.set_title("Network Latency Over Time")
+    ax.set_xlabel("Time")
+    ax.set_ylabel("Latency (ms)")
+
+
+def _draw_throughput(
+    ax,
+    timestamps: np.ndarray,
+    downlink: np.ndarray,
+    uplink: Optional[np.ndarray] = None,
+) -> None:
+    """Draw downlink (and uplink, if present) throughput over time onto ax"""
+    ax.tick_params(axis="x", labelrotation=45)
+    # Convert to Mbps for better readability, as plain arrays so the
+    # caller's DataFrame never gains columns
+    if uplink is not None:
+        ax.plot(
+            *_decimate(timestamps, _mbps(uplink)),
+            linewidth=1,
+            alpha=0.7,
+            label="Uplink",
+        )
+
+    ax.plot(
+        *_decimate(timestamps, _mbps(downlink)),
+        linewidth=1,
+        alpha=0.7,
+        label="Downlink",
+    )
+
+    ax.set_title("Network Throughput Over Time")
+    ax.set_xlabel("Time")
+    ax.set_ylabel("Throughput (Mbps)")
+
+
+def _draw_packet_loss(ax, timestamps: np.ndarray, packet_loss: np.ndarray) -> None:
+    """Draw packet loss over time onto ax"""
+    ax.tick_params(axis="x", labelrotation=45)
+    ax.plot(
+        *_decimate(timestamps, packet_loss),
+        linewidth=1,
+        alpha=0.7,
+        color="red",
+        label="Packet Loss",
+    )
+    ax.set_title("Packet Loss Over Time")
+    ax.set_xlabel("Time")
+    ax.set_ylabel("Packet Loss (%)")
+
+
+def _draw_bars(
+    ax,
+    values: Dict[str, Any],
+    keys: Tuple[str, ...],
+    title: str,
+    ylabel: str,
+    color: str,
+    labels: Optional[Tuple[str, ...]] = None,
+) -> None:
+    """Draw values[key] for each key (0 when missing) as a bar chart onto ax"""
+    heights = np.fromiter(
+        (values.get(key, 0) for key in keys), dtype=np.float64, count=len(keys)
+    )
+    ax.bar(labels or keys, heights, color=color)
+    ax.set_title(title)
+    ax.set_ylabel(ylabel)
+
+
+def _draw_record_count(ax, stats: Dict[str, Any]) -> None:
+    """Draw the total record count as a text panel onto ax"""
+    ax.text(
+        0.5,
+        0.5,
+        f"Total Records\n{stats.get('total_records', 0)}",
+        ha="center",
+        va="center",
+        fontsize=20,
+        transform=ax.transAxes,
+    )
+    ax.set_title("Data Summary")
+    ax.axis("off")
+
+
+def _write_file(item: Tuple[str, bytes]) -> None:
+    """Write one rendered chart to its path"""
+    path, content = item
+    with open(path, "wb") as f:
+        f.write(content)
+
+
+def _render_chart(
+    kind: str, source: Any, output_path: str, dpi: int, image_format: str
+) -> Optional[str]:
+    """Draw one create_all_charts chart in a worker process"""
+    visualizer = Visualizer(
+        batch_writes=False, max_workers=1, image_format=image_format
+    )
+    try:
+        return getattr(visualizer, _CHART_METHODS[kind])(source, output_path, dpi)
+    finally:
+        visualizer.close()
 
 
 class Visualizer:
     """Creates visualizations for network analysis data"""
 
-    def __init__(self):
-        # Set style for consistent plotting
-        plt.style.use("default")
-        sns.set_palette("husl")
+    def __init__(
+        self,
+        batch_writes: bool = True,
+        max_workers: int = 1,
+        image_format: str = "png",
+    ):
+        if image_format not in IMAGE_FORMATS:
+            raise ValueError(f"Unsupported image format: {image_format}")
+        # "png" or "svg"; SVG charts are returned as text rather than base64
+        self.image_format = image_format
+
+        # When set, create_all_charts renders every chart to memory first and
+        # writes the files together at the end instead of one by one
+        self.batch_writes = batch_writes
+        self._pending_writes: Optional[List[Tuple[str, bytes]]] = None
+
+        # Processes create_all_charts may draw charts in. The default of 1
+        # draws them inline, reusing figures and batching the writes; for
+        # four small charts that beats starting a process pool
+        self.max_workers = max_workers
+
+        # Figures reused across charts, keyed by (nrows, ncols, figsize)
+        self._figures: Dict[Tuple[int, int, Tuple[float, float]], Any] = {}
+
+    def _get_figure(
+        self, nrows: int = 1, ncols: int = 1, figsize: Tuple[float, float] = (12, 6)
+    ):
+        """
+        Return a cleared Figure and its Axes for a layout, creating it once
+
+        The figures live outside pyplot, so reusing them skips building a new
+        figure and canvas for every chart without anything left to close.
+        """
+        key = (nrows, ncols, figsize)
+        cached = self._figures.get(key)
+        if cached is None:
+            fig = Figure(figsize=figsize)
+            cached = self._figures[key] = (fig, fig.subplots(nrows, ncols))
+        else:
+            fig, axes = cached
+            for ax in np.atleast_1d(axes).flat:
+                ax.clear()
+            # Start tight_layout from the defaults again, as on a new figure
+            fig.subplots_adjust(
+                **{
+                    param: matplotlib.rcParams[f"figure.subplot.{param}"]
+                    for param in _SUBPLOT_PARAMS
+                }
+            )
+        return cached
+
+    def close(self) -> None:
+        """
+        Release the cached figures and their canvases
+
+        Charts never go through pyplot, so there is no global figure to
+        plt.close(); the Visualizer holds the only references. Using it again
+        afterwards simply creates new figures.
+        """
+        figures, self._figures = self._figures, {}
+        for fig, _ in figures.values():
+            fig.clear()
+
+    def _save_figure(self, fig, output_path: str, dpi: int) -> None:
+        """Save a figure, or queue it while a batch is open"""
+        if self._pending_writes is None:
+            _savefig(fig, output_path, dpi, self.image_format)
+            return
+
+        buffer = io.BytesIO()
+        _savefig(fig, buffer, dpi, self.image_format)
+        self._pending_writes.append((output_path, buffer.getvalue()))
+
+    def _render_output(self, fig, output_path: Optional[str], dpi: int) -> str:
+        """
+        Save a figure to output_path, or return it as a base64 PNG or as
+        SVG text
+        """
+        if output_path:
+            self._save_figure(fig, output_path, dpi)
+            return output_path
+
+        buffer = io.BytesIO()
+        _savefig(fig, buffer, dpi, self.image_format)
+        if self.image_format == "svg":
+            # SVG is already text and needs no base64 wrapping
+            return buffer.getvalue().decode("utf-8")
+        # Encode straight from the buffer's memory instead of a bytes copy
+        return base64.b64encode(buffer.getbuffer()).decode("ascii")
+
+    @staticmethod
+    def _flush_writes(pending: List[Tuple[str, bytes]]) -> None:
+        """Write queued chart files concurrently"""
+        workers = min(len(pending), MAX_WRITE_WORKERS)
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            # Consume the results so write errors propagate
+            list(executor.map(_write_file, pending))
 
     def create_latency_chart(
-        self, data: List[Dict[str, Any]], output_path: Optional[str] = None
+        self,
+        data: ChartData,
+        output_path: Optional[str] = None,
+        dpi: int = DEFAULT_DPI,
     ) -> Optional[str]:
         """Create a latency over time chart"""
-        if not data:
+        if data is None or len(data) == 0:
             return None
 
-        df = pd.DataFrame(data)
-        if "timestamp" not in df or "ping_latency_ms" not in df:
+        columns = _columns(data, "timestamp", "ping_latency_ms")
+        if columns is None:
             return None
+        timestamps, latency = columns
 
-        plt.figure(figsize=(12, 6))
-        plt.plot(
-            df["timestamp"],
-            df["ping_latency_ms"],
-            linewidth=1,
-            alpha=0.7,
-            label="Ping Latency",
-        )
-        plt.title("Network Latency Over Time")
-        plt.xlabel("Time")
-        plt.ylabel("Latency (ms)")
-        plt.xticks(rotation=45)
-        plt.tight_layout()
-        plt.legend()
+        fig, ax = self._get_figure()
+        _draw_latency(ax, timestamps, latency)
+        fig.tight_layout()
+        ax.legend()
 
-        if output_path:
-            plt.savefig(output_path, dpi=300, bbox_inches="tight")
-            plt.close()
-            return output_path
-        else:
-            # Return base64 encoded image
-            buffer = io.BytesIO()
-            plt.savefig(buffer, format="png", dpi=300, bbox_inches="tight")
-            buffer.seek(0)
-            image_base64 = base64.b64encode(buffer.getvalue()).decode()
-            plt.close()
-            return image_base64
+        return self._render_output(fig, output_path, dpi)
 
     def create_throughput_chart(
-        self, data: List[Dict[str, Any]], output_path: Optional[str] = None
+        self,
+        data: ChartData,
+        output_path: Optional[str] = None,
+        dpi: int = DEFAULT_DPI,
     ) -> Optional[str]:
         """Create a throughput over time chart"""
-        if not data:
+        if data is None or len(data) == 0:
             return None
 
-        df = pd.DataFrame(data)
-        required_cols = ["timestamp", "downlink_throughput_bps"]
-        if not all(col in df.columns for col in required_cols):
+        columns = _columns(data, "timestamp", "downlink_throughput_bps")
+        if columns is None:
             return None
+        uplink = _columns(data, "uplink_throughput_bps")
+        if uplink is not None:
+            columns += uplink
 
-        plt.figure(figsize=(12, 6))
-
-        # Convert to Mbps for better readability
-        df["downlink_mbps"] = df["downlink_throughput_bps"] / 1_000_000
-        if "uplink_throughput_bps" in df.columns:
-            df["uplink_mbps"] = df["uplink_throughput_bps"] / 1_000_000
-            plt.plot(
-                df["timestamp"],
-                df["uplink_mbps"],
-                linewidth=1,
-                alpha=0.7,
-                label="Uplink",
-            )
+        fig, ax = self._get_figure()
+        _draw_throughput(ax, *columns)
+        fig.tight_layout()
+        ax.legend()
 
-        plt.plot(
-            df["timestamp"],
-            df["downlink_mbps"],
-            linewidth=1,
-            alpha=0.7,
-            label="Downlink",
-        )
-
-        plt.title("Network Throughput Over Time")
-        plt.xlabel("Time")
-        plt.ylabel("Throughput (Mbps)")
-        plt.xticks(rotation=45)
-        plt.tight_layout()
-        plt.legend()
-
-        if output_path:
-            plt.savefig(output_path, dpi=300, bbox_inches="tight")
-            plt.close()
-            return output_path
-        else:
-            buffer = io.BytesIO()
-            plt.savefig(buffer, format="png", dpi=300, bbox_inches="tight")
-            buffer.seek(0)
-            image_base64 = base64.b64encode(buffer.getvalue()).decode()
-            plt.close()
-            return image_base64
+        return self._render_output(fig, output_path, dpi)
 
     def create_packet_loss_chart(
-        self, data: List[Dict[str, Any]], output_path: Optional[str] = None
+        self,
+        data: ChartData,
+        output_path: Optional[str] = None,
+        dpi: int = DEFAULT_DPI,
     ) -> Optional[str]:
         """Create a packet loss over time chart"""
-        if not data:
+        if data is None or len(data) == 0:
             return None
 
-        df = pd.DataFrame(data)
-        if "timestamp" not in df or "packet_loss_pct" not in df:
+        columns = _columns(data, "timestamp", "packet_loss_pct")
+        if columns is None:
             return None
+        timestamps, packet_loss = columns
 
-        plt.figure(figsize=(12, 6))
-        plt.plot(
-            df["timestamp"],
-            df["packet_loss_pct"],
-            linewidth=1,
-            alpha=0.7,
-            color="red",
-            label="Packet Loss",
-        )
-        plt.title("Packet Loss Over Time")
-        plt.xlabel("Time")
-        plt.ylabel("Packet Loss (%)")
-        plt.xticks(rotation=45)
-        plt.tight_layout()
-        plt.legend()
+        fig, ax = self._get_figure()
+        _draw_packet_loss(ax, timestamps, packet_loss)
+        fig.tight_layout()
+        ax.legend()
 
-        if output_path:
-            plt.savefig(output_path, dpi=300, bbox_inches="tight")
-            plt.close()
-            return output_path
-        else:
-            buffer = io.BytesIO()
-            plt.savefig(buffer, format="png", dpi=300, bbox_inches="tight")
-            buffer.seek(0)
-            image_base64 = base64.b64encode(buffer.getvalue()).decode()
-            plt.close()
-            return image_base64
+        return self._render_output(fig, output_path, dpi)
 
     def create_statistics_summary(
-        self, stats: Dict[str, Any], output_path: Optional[str] = None
+        self,
+        stats: Dict[str, Any],
+        output_path: Optional[str] = None,
+        dpi: int = DEFAULT_DPI,
     ) -> Optional[str]:
         """Create a visual summary of statistics"""
-        fig, axes = plt.subplots(2, 2, figsize=(15, 10))
+        fig, axes = self._get_figure(2, 2, figsize=(15, 10))
         fig.suptitle("Network Performance Statistics Summary", fontsize=16)
 
         # Ping statistics
         if "ping_stats" in stats:
-            ping_stats = stats["ping_stats"]
-            metrics = ["mean", "median", "min", "max"]
-            values = [ping_stats.get(m, 0) for m in metrics]
-
-            axes[0, 0].bar(metrics, values, color="skyblue")
-            axes[0, 0].set_title("Ping Latency Statistics (ms)")
-            axes[0, 0].set_ylabel("Latency (ms)")
+            _draw_bars(
+                axes[0, 0],
+                stats["ping_stats"],
+                ("mean", "median", "min", "max"),
+                "Ping Latency Statistics (ms)",
+                "Latency (ms)",
+                "skyblue",
+            )
 
         # Packet loss statistics
         if "packet_loss_stats" in stats:
-            loss_stats = stats["packet_loss_stats"]
-            metrics = ["mean", "median", "max"]
-            values = [loss_stats.get(m, 0) for m in metrics]
-
-            axes[0, 1].bar(metrics, values, color="lightcoral")
-            axes[0, 1].set_title("Packet Loss Statistics (%)")
-            axes[0, 1].set_ylabel("Packet Loss (%)")
+            _draw_bars(
+                axes[0, 1],
+                stats["packet_loss_stats"],
+                ("mean", "median", "max"),
+                "Packet Loss Statistics (%)",
+                "Packet Loss (%)",
+                "lightcoral",
+            )
 
         # Throughput statistics
         if "throughput_stats" in stats:
-            throughput = stats["throughput_stats"]
-            labels = ["Downlink", "Uplink"]
-            values = [
-                throughput.get("downlink_mean_mbps", 0),
-                throughput.get("uplink_mean_mbps", 0),
-            ]
-
-            axes[1, 0].bar(labels, values, color="lightgreen")
-            axes[1, 0].set_title("Average Throughput (Mbps)")
-            axes[1, 0].set_ylabel("Throughput (Mbps)")
+            _draw_bars(
+                axes[1, 0],
+                stats["throughput_stats"],
+                ("downlink_mean_mbps", "uplink_mean_mbps"),
+                "Average Throughput (Mbps)",
+                "Throughput (Mbps)",
+                "lightgreen",
+                labels=("Downlink", "Uplink"),
+            )
 
         # Record count
-        axes[1, 1].text(
-            0.5,
-            0.5,
-            f"Total Records\n{stats.get('total_records', 0)}",
-            ha="center",
-            va="center",
-            fontsize=20,
-            transform=axes[1, 1].transAxes,
+        _draw_record_count(axes[1, 1], stats)
+
+        fig.tight_layout()
+
+        return self._render_output(fig, output_path, dpi)
+
+    def create_combined_dashboard(
+        self,
+        data: ChartData,
+        stats: Dict[str, Any],
+        output_path: Optional[str] = None,
+        dpi: int = DEFAULT_DPI,
+    ) -> Optional[str]:
+        """
+        Create latency, throughput, packet loss and record count panels as
+        one 2x2 figure, encoded and saved once
+        """
+        if data is None or len(data) == 0:
+            return None
+
+        fig, axes = self._get_figure(2, 2, figsize=(20, 12))
+        fig.suptitle("Network Performance Dashboard", fontsize=16)
+
+        throughput = _columns(data, "timestamp", "downlink_throughput_bps")
+        uplink = _columns(data, "uplink_throughput_bps")
+        if throughput is not None and uplink is not None:
+            throughput += uplink
+
+        panels = (
+            (axes[0, 0], _draw_latency, _columns(data, "timestamp", "ping_latency_ms")),
+            (axes[0, 1], _draw_throughput, throughput),
+            (
+                axes[1, 0],
+                _draw_packet_loss,
+                _columns(data, "timestamp", "packet_loss_pct"),
+            ),
         )
-        axes[1, 1].set_title("Data Summary")
-        axes[1, 1].axis("off")
+        drawn = []
+        for ax, draw, columns in panels:
+            if columns is None:
+                ax.axis("off")
+                continue
+            draw(ax, *columns)
+            drawn.append(ax)
 
-        plt.tight_layout()
+        _draw_record_count(axes[1, 1], stats)
 
-        if output_path:
-            plt.savefig(output_path, dpi=300, bbox_inches="tight")
-            plt.close()
-            return output_path
-        else:
-            buffer = io.BytesIO()
-            plt.savefig(buffer, format="png", dpi=300, bbox_inches="tight")
-            buffer.seek(0)
-            image_base64 = base64.b64encode(buffer.getvalue()).decode()
-            plt.close()
-            return image_base64
+        fig.tight_layout()
+        for ax in drawn:
+            ax.legend()
+
+        return self._render_output(fig, output_path, dpi)
 
     def create_all_charts(
         self,
-        data: List[Dict[str, Any]],
+        data: ChartData,
         stats: Dict[str, Any],
-        output_dir: str = "./charts",
+        output_dir: Union[str, Path] = "./charts",
+        dpi: int = DEFAULT_DPI,
+        combined: bool = False,
     ) -> Dict[str, str]:
-        """Create all visualization charts and return paths"""
+        """
+        Create all visualization charts and return paths
+
+        With combined=True a single dashboard file holding every panel is
+        written instead of one file per chart. Files are named after the
+        Visualizer's image format (.png or .svg).
+        """
         charts = {}
 
         # Create output directory if it doesn't exist
-        import os
-
-        os.makedirs(output_dir, exist_ok=True)
-
-        # Generate all charts
-        latency_path = f"{output_dir}/latency_chart.png"
-        throughput_path = f"{output_dir}/throughput_chart.png"
-        packet_loss_path = f"{output_dir}/packet_loss_chart.png"
-        summary_path = f"{output_dir}/statistics_summary.png"
-
-        charts["latency"] = self.create_latency_chart(data, latency_path)
-        charts["throughput"] = self.create_throughput_chart(data, throughput_path)
-        charts["packet_loss"] = self.create_packet_loss_chart(data, packet_loss_path)
-        charts["summary"] = self.create_statistics_summary(stats, summary_path)
+        output_dir = Path(output_dir)
+        output_dir.mkdir(parents=True, exist_ok=True)
+
+        # Generate all charts; paths are returned as strings, as before
+        ext = self.image_format
+        latency_path = str(output_dir / f"latency_chart.{ext}")
+        throughput_path = str(output_dir / f"throughput_chart.{ext}")
+        packet_loss_path = str(output_dir / f"packet_loss_chart.{ext}")
+        summary_path = str(output_dir / f"statistics_summary.{ext}")
+
+        # Turn row records into columns once; DataFrames and structured
+        # arrays are read as-is. Every line chart needs timestamps, so
+        # records without them are left alone rather than converted for nothing
+        if isinstance(data, list) and data and _has_columns(data, "timestamp"):
+            data = pd.DataFrame(data)
+
+        jobs = {
+            "latency": (data, latency_path),
+            "throughput": (data, throughput_path),
+            "packet_loss": (data, packet_loss_path),
+            "summary": (stats, summary_path),
+        }
+
+        # The charts are independent figures, so they can rasterize in
+        # parallel; each worker saves its own file
+        workers = min(self.max_workers, len(jobs))
+        if not combined and workers > 1:
+            with ProcessPoolExecutor(max_workers=workers) as executor:
+                futures = {
+                    kind: executor.submit(
+                        _render_chart, kind, source, path, dpi, self.image_format
+                    )
+                    for kind, (source, path) in jobs.items()
+                }
+            return {kind: future.result() for kind, future in futures.items()}
+
+        if self.batch_writes:
+            self._pending_writes = []
+
+        try:
+            if combined:
+                charts["dashboard"] = self.create_combined_dashboard(
+                    data, stats, str(output_dir / f"dashboard.{ext}"), dpi
+                )
+            else:
+                for kind, (source, path) in jobs.items():
+                    draw = getattr(self, _CHART_METHODS[kind])
+                    charts[kind] = draw(source, path, dpi)
+        finally:
+            pending, self._pending_writes = self._pending_writes, None
+
+        if pending:
+            self._flush_writes(pending)
 
         return charts
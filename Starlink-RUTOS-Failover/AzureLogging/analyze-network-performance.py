@@ -31,37 +31,408 @@ Recommended (new modular version):
     python network-analyzer.py --storage-account myaccount --days 30 --visualizations
 """
 
+from __future__ import annotations
+
 import argparse
+import functools
+import io
 import logging
+import os
 import sys
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
 from datetime import datetime, timedelta
-from typing import Dict, List, Optional
+from typing import Dict, Iterable, Iterator, List, Optional, Tuple
 import re
-import json
 from pathlib import Path
 
-# Azure and data analysis imports
-try:
-    from azure.storage.blob import BlobServiceClient
-    from azure.identity import DefaultAzureCredential
-    import pandas as pd
-    import matplotlib.pyplot as plt
-    import matplotlib.dates as mdates
-    import seaborn as sns
-    from collections import defaultdict, Counter
-except ImportError as e:
-    print(f"Missing required package: {e}")
+
+def _missing_package(error: ImportError) -> None:
+    """Explain how to install the dependencies and exit"""
+    print(f"Missing required package: {error}")
     print(
-        "Install with: pip install azure-storage-blob pandas matplotlib seaborn azure-identity"
+        "Install with: pip install azure-storage-blob pandas matplotlib seaborn azure-identity orjson"
     )
     sys.exit(1)
 
+
+def _import_dependencies() -> None:
+    """
+    Import Azure and the data analysis packages into the module globals
+
+    They take a second or two to load, so this runs when the first
+    NetworkAnalyzer is created rather than at import, keeping --help and
+    argument errors instant.
+    """
+    global BlobServiceClient, DefaultAzureCredential, np, orjson, pd
+
+    try:
+        from azure.storage.blob import BlobServiceClient
+        from azure.identity import DefaultAzureCredential
+        import numpy as np
+        import orjson
+        import pandas as pd
+    except ImportError as e:
+        _missing_package(e)
+
+
+def _import_plotting() -> None:
+    """Import matplotlib and seaborn, only needed with --visualizations"""
+    global plt, mdates, sns
+
+    try:
+        import matplotlib
+
+        # Charts are only written to files; skip probing for a display backend
+        matplotlib.use("Agg")
+
+        import matplotlib.pyplot as plt
+        import matplotlib.dates as mdates
+        import seaborn as sns
+    except ImportError as e:
+        _missing_package(e)
+
+
 # Configure logging
 logging.basicConfig(
     level=logging.INFO, format="%(asctime)s - %(levelname)s - %(message)s"
 )
 logger = logging.getLogger(__name__)
 
+# RUTOS log format: timestamp hostname process[pid]: message
+# Example: Jul 14 10:30:45 RUTX50 kernel: [12345.678] message
+# Matched against whole blocks of lines, so whitespace and the process name
+# must not run past a line break
+_LOG_RE = re.compile(
+    r"^(\w{3}[^\S\n]+\d{1,2}[^\S\n]+\d{2}:\d{2}:\d{2})[^\S\n]+(\w+)[^\S\n]+"
+    r"([^:\n]+):[^\S\n]*(.+)",
+    re.MULTILINE,
+)
+
+# Syslog month abbreviations
+_MONTHS = {
+    "Jan": 1,
+    "Feb": 2,
+    "Mar": 3,
+    "Apr": 4,
+    "May": 5,
+    "Jun": 6,
+    "Jul": 7,
+    "Aug": 8,
+    "Sep": 9,
+    "Oct": 10,
+    "Nov": 11,
+    "Dec": 12,
+}
+
+# Blob names are a prefix followed by the day they cover, as written by the
+# log shipper and the HttpLogIngestor function
+_BLOB_NAME_PREFIXES = ("", "router-", "starlink-performance-")
+
+# Keywords identifying failover and reboot events, in any case
+_FAILOVER_KEYWORDS = (
+    "failover",
+    "switching to backup",
+    "starlink down",
+    "primary wan down",
+    "backup wan up",
+    "connection restored",
+    "wan failover",
+)
+_REBOOT_KEYWORDS = (
+    "system startup",
+    "kernel:",
+    "init:",
+    "booting",
+    "system halt",
+    "restart",
+    "reboot",
+    "shutdown",
+)
+_FAILOVER_RE = re.compile("|".join(map(re.escape, _FAILOVER_KEYWORDS)), re.IGNORECASE)
+_REBOOT_RE = re.compile("|".join(map(re.escape, _REBOOT_KEYWORDS)), re.IGNORECASE)
+
+# Columns of the failover and reboot event frames
+_EVENT_FIELDS = ["timestamp", "type", "message", "process"]
+
+# Fields of a parsed log line, in _LOG_RE group order. The raw line is not
+# kept; it would double the memory of system_logs for debugging only
+_LOG_FIELDS = ("timestamp", "hostname", "process", "message")
+
+# Performance CSV columns by position, as written by starlink-azure-monitor-rutos.sh
+_PERFORMANCE_COLUMNS = (
+    "timestamp",
+    "uptime_s",
+    "downlink_throughput_bps",
+    "uplink_throughput_bps",
+    "ping_drop_rate",
+    "ping_latency_ms",
+    "obstruction_duration_s",
+    "obstruction_fraction",
+    "currently_obstructed",
+    "snr",
+    "alerts_thermal_throttle",
+    "alerts_thermal_shutdown",
+    "alerts_mast_not_near_vertical",
+    "alerts_motors_stuck",
+    "alerts_slow_ethernet_speeds",
+    "alerts_software_install_pending",
+    "dishy_state",
+    "mobility_class",
+    "latitude",
+    "longitude",
+    "altitude_m",
+    "speed_kmh",
+    "heading_deg",
+    "gps_source",
+    "gps_satellites",
+    "gps_accuracy_m",
+)
+
+# Alerts that are parsed but not analyzed
+_UNUSED_COLUMNS = (
+    "alerts_mast_not_near_vertical",
+    "alerts_motors_stuck",
+    "alerts_slow_ethernet_speeds",
+    "alerts_software_install_pending",
+)
+
+# Columns kept from the CSV
+_PERFORMANCE_FIELDS = tuple(
+    column for column in _PERFORMANCE_COLUMNS if column not in _UNUSED_COLUMNS
+)
+
+# Lines shorter than the timestamp plus the seven core metrics are skipped
+_MIN_PERFORMANCE_FIELDS = 8
+
+# Metrics that count as 0 when their cell is empty
+_ZERO_FILLED_COLUMNS = (
+    "uptime_s",
+    "downlink_throughput_bps",
+    "uplink_throughput_bps",
+    "ping_drop_rate",
+    "ping_latency_ms",
+    "obstruction_duration_s",
+    "obstruction_fraction",
+    "snr",
+)
+
+# true/false columns, False when missing
+_FLAG_COLUMNS = (
+    "currently_obstructed",
+    "alerts_thermal_throttle",
+    "alerts_thermal_shutdown",
+)
+
+# GPS readings, NaN when missing
+_GPS_COLUMNS = (
+    "latitude",
+    "longitude",
+    "altitude_m",
+    "speed_kmh",
+    "heading_deg",
+    "gps_accuracy_m",
+)
+
+_TEXT_COLUMNS = ("dishy_state", "mobility_class", "gps_source")
+
+# Mean Earth radius used for GPS distances
+EARTH_RADIUS_KM = 6371
+
+# Blobs fetched concurrently; downloads are network-bound
+MAX_DOWNLOAD_WORKERS = 16
+
+# Mobility states by speed: stationary below 1 km/h, walking below 5, ...
+_MOBILITY_STATES = (
+    "stationary",
+    "walking",
+    "cycling",
+    "driving_urban",
+    "driving_highway",
+    "high_speed",
+)
+_MOBILITY_SPEED_BINS = (-float("inf"), 1, 5, 25, 60, 100, float("inf"))
+
+# Distinct longitudes at 0.001 degree resolution, used to pack rounded
+# coordinates into a single integer key
+_LON_KEYS = 360_001
+
+# Rows parsed per read_csv chunk
+PERFORMANCE_CHUNK_ROWS = 100_000
+
+# Characters of system log text matched per block (whole lines)
+SYSTEM_LOG_CHUNK_CHARS = 8 * 1024 * 1024
+
+# Line plots keep at most this many points per series; a 15in subplot row
+# at 300 dpi has about 2000 pixel columns per subplot, so longer series
+# only overdraw the same columns
+MAX_PLOT_POINTS = 4000
+
+# Most plotting processes worth starting; create_visualizations draws six
+# independent charts at most
+MAX_PLOT_WORKERS = 4
+
+# Above this many GPS points the coverage maps are drawn as hexagonal bins
+# (mean value per bin) instead of one marker per point
+HEXBIN_MIN_POINTS = 20_000
+
+
+class _ChunkStream(io.RawIOBase):
+    """
+    Read-only binary stream over an iterator of byte chunks, such as
+    StorageStreamDownloader.chunks(), so a blob can be parsed as it arrives
+    """
+
+    def __init__(self, chunks: Iterable[bytes]):
+        self._chunks: Iterator[bytes] = iter(chunks)
+        self._pending = memoryview(b"")
+
+    def readable(self) -> bool:
+        return True
+
+    def readinto(self, buffer) -> int:
+        while not self._pending:
+            try:
+                self._pending = memoryview(next(self._chunks))
+            except StopIteration:
+                return 0
+
+        size = min(len(buffer), len(self._pending))
+        buffer[:size] = self._pending[:size]
+        self._pending = self._pending[size:]
+        return size
+
+
+def _haversine_km(lat1, lon1, lat2, lon2) -> np.ndarray:
+    """
+    Distances in km between arrays of GPS points, by the Haversine formula
+    """
+    lat1, lon1, lat2, lon2 = map(np.radians, (lat1, lon1, lat2, lon2))
+
+    dlat = lat2 - lat1
+    dlon = lon2 - lon1
+    a = np.sin(dlat / 2) ** 2 + np.cos(lat1) * np.cos(lat2) * np.sin(dlon / 2) ** 2
+    return 2 * EARTH_RADIUS_KM * np.arcsin(np.sqrt(a))
+
+
+def _json_default(obj):
+    """Serialize values orjson does not know (pandas timestamps, NaT)"""
+    if obj is pd.NaT:
+        return None
+    if hasattr(obj, "isoformat"):
+        return obj.isoformat()
+    return str(obj)
+
+
+def _dumps(obj, option: int = 0) -> bytes:
+    """
+    Serialize analysis results to JSON with orjson
+
+    NumPy values and datetimes are written natively, and non-string keys
+    such as the dates of the daily failover distribution become strings.
+    Naive datetimes stay naive: syslog times are router local time.
+    """
+    return orjson.dumps(
+        obj,
+        default=_json_default,
+        option=option | orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_NON_STR_KEYS,
+    )
+
+
+def _set_plot_style() -> None:
+    """Apply the chart style shared by every plot"""
+    plt.style.use("seaborn-v0_8")
+    sns.set_palette("husl")
+
+
+def _render_plot(name: str, output_dir: str, *data) -> None:
+    """
+    Draw one NetworkAnalyzer._plot_* chart in a worker process
+
+    The dependencies are imported again because spawned workers start with
+    a fresh module.
+    """
+    _import_dependencies()
+    _import_plotting()
+    _set_plot_style()
+    getattr(NetworkAnalyzer, name)(output_dir, *data)
+
+
+def _cached_analysis(method):
+    """
+    Reuse an analysis method's result until download_data loads new data
+    """
+
+    @functools.wraps(method)
+    def wrapper(self):
+        cache = self._analysis_cache
+        if method.__name__ not in cache:
+            cache[method.__name__] = method(self)
+        return cache[method.__name__]
+
+    return wrapper
+
+
+def _prefix_sums(values) -> np.ndarray:
+    """
+    Running totals with a leading zero, so sums[j] - sums[i] == sum(values[i:j])
+    """
+    sums = np.zeros(len(values) + 1)
+    np.cumsum(np.asarray(values), out=sums[1:])
+    return sums
+
+
+def _percentiles(values, *fractions: float) -> List[float]:
+    """
+    Return the value at index int(len(values) * fraction) of the sorted values
+
+    np.partition places just those order statistics, in linear time,
+    instead of sorting everything.
+    """
+    ranks = [int(len(values) * fraction) for fraction in fractions]
+    return np.partition(np.asarray(values), ranks)[ranks].tolist()
+
+
+def _decimate(x: np.ndarray, y: np.ndarray, max_points: int = MAX_PLOT_POINTS):
+    """
+    Thin a series to about max_points samples for plotting
+
+    The series is cut into max_points / 2 equal buckets and the minimum and
+    maximum of each are kept, so spikes survive unlike with a plain stride.
+
+    A copy of analysis.visualizer._decimate; keep the two in step. This
+    script runs standalone, and importing the analysis package would load
+    its downloader (aiohttp and the async Azure SDK) and matplotlib just for
+    this function.
+    """
+    n = len(y)
+    if n <= max_points:
+        return x, y
+
+    buckets = max_points // 2
+    size = -(-n // buckets)
+    values = np.full(buckets * size, np.nan)
+    values[:n] = y
+    values = values.reshape(buckets, size)
+
+    # NaNs (gaps and padding) must never win the min/max
+    missing = np.isnan(values)
+    lowest = np.where(missing, np.inf, values).argmin(axis=1)
+    highest = np.where(missing, -np.inf, values).argmax(axis=1)
+
+    starts = np.arange(buckets) * size
+    keep = np.unique(np.concatenate((starts + lowest, starts + highest)))
+    keep = keep[keep < n]
+    return x[keep], y[keep]
+
+
+def _flagged_messages(flags, template: str, values) -> List[Optional[str]]:
+    """
+    Format template with each value whose flag is set, None elsewhere
+    """
+    return [
+        template.format(value) if flag else None for flag, value in zip(flags, values)
+    ]
+
 
 class NetworkAnalyzer:
     """
@@ -76,6 +447,8 @@ class NetworkAnalyzer:
             storage_account: Azure Storage account name
             credential: Azure credential (defaults to DefaultAzureCredential)
         """
+        _import_dependencies()
+
         self.storage_account = storage_account
         self.credential = credential or DefaultAzureCredential()
 
@@ -85,15 +458,31 @@ class NetworkAnalyzer:
             credential=self.credential,
         )
 
-        # Data containers
-        self.system_logs = []
-        self.performance_data = []
+        # Data containers. Logs, events and performance data are parsed into
+        # DataFrame chunks, which download_data concatenates
+        self.log_frames = []
+        self.system_logs = pd.DataFrame(columns=list(_LOG_FIELDS))
+        self.performance_frames = []
+        # A typed timestamp column keeps the empty frame's index datetime64
+        self.performance_data = pd.DataFrame(columns=list(_PERFORMANCE_FIELDS)).astype(
+            {"timestamp": "datetime64[ns]"}
+        )
+        self.perf_df = self.performance_data.set_index("timestamp")
 
         # Analysis results
-        self.failover_events = []
-        self.reboot_events = []
+        self.failover_frames = []
+        self.failover_events = pd.DataFrame(columns=_EVENT_FIELDS)
+        self.reboot_frames = []
+        self.reboot_events = pd.DataFrame(columns=_EVENT_FIELDS)
         self.performance_degradation = []
-        self.threshold_violations = []
+        # Violating performance rows plus their "violations" messages
+        self.violation_frames = []
+        self.threshold_violations = pd.DataFrame(
+            columns=[*_PERFORMANCE_FIELDS, "violations"]
+        )
+
+        # Results of the @_cached_analysis methods for the current data
+        self._analysis_cache = {}
 
     def download_data(self, days_back: int = 30) -> None:
         """
@@ -120,6 +509,8 @@ class NetworkAnalyzer:
                 performance_container, start_date, end_date, "performance"
             )
 
+            self._finalize()
+
             logger.info(f"Downloaded {len(self.system_logs)} system log entries")
             logger.info(
                 f"Downloaded {len(self.performance_data)} performance data points"
@@ -129,6 +520,46 @@ class NetworkAnalyzer:
             logger.error(f"Error downloading data: {e}")
             raise
 
+    def _finalize(self) -> None:
+        """
+        Build the DataFrames the analyses share, once per download
+        """
+        if self.log_frames:
+            self.system_logs = pd.concat(self.log_frames, ignore_index=True)
+            self.log_frames = [self.system_logs]
+
+        if self.failover_frames:
+            self.failover_events = pd.concat(self.failover_frames, ignore_index=True)
+            self.failover_frames = [self.failover_events]
+
+        if self.reboot_frames:
+            self.reboot_events = pd.concat(self.reboot_frames, ignore_index=True)
+            self.reboot_frames = [self.reboot_events]
+
+        if self.performance_frames:
+            performance_data = pd.concat(self.performance_frames, ignore_index=True)
+            # Blobs are read day by day, so the samples are normally in time
+            # order already; sort (a second full copy) only when they are not
+            if not performance_data["timestamp"].is_monotonic_increasing:
+                performance_data = performance_data.sort_values(
+                    "timestamp", kind="stable", ignore_index=True
+                )
+            self.performance_data = performance_data
+            # Keep only the combined frame so the chunks are not held twice
+            self.performance_frames = [self.performance_data]
+
+        if self.violation_frames:
+            self.threshold_violations = pd.concat(
+                self.violation_frames, ignore_index=True
+            )
+            self.violation_frames = [self.threshold_violations]
+
+        # Time-indexed view of the same columns for resampling
+        self.perf_df = self.performance_data.set_index("timestamp")
+
+        # Earlier analysis results describe the previous data
+        self._analysis_cache.clear()
+
     def _download_logs(
         self, container_client, start_date: datetime, end_date: datetime, log_type: str
     ) -> None:
@@ -136,360 +567,278 @@ class NetworkAnalyzer:
         Download logs from a specific container within date range
         """
         try:
-            blobs = container_client.list_blobs()
-
-            for blob in blobs:
-                # Parse date from blob name (assuming format: router-YYYY-MM-DD.log or YYYY-MM-DD.csv)
-                blob_date = self._extract_date_from_blob_name(blob.name)
-
-                if blob_date and start_date.date() <= blob_date <= end_date.date():
-                    logger.info(f"Downloading {blob.name}")
-
-                    blob_client = container_client.get_blob_client(blob.name)
-                    content = blob_client.download_blob().readall().decode("utf-8")
+            # List only the blobs named after a day in range instead of the
+            # whole container (router-YYYY-MM-DD.log, YYYY-MM-DD.csv, ...)
+            jobs = []
+            blob_date = start_date.date()
+            while blob_date <= end_date.date():
+                for prefix in _BLOB_NAME_PREFIXES:
+                    blobs = container_client.list_blobs(
+                        name_starts_with=f"{prefix}{blob_date.isoformat()}"
+                    )
+                    jobs.extend((blob.name, blob_date) for blob in blobs)
+                blob_date += timedelta(days=1)
+
+            # Start the downloads in worker threads; parsing stays on this
+            # thread, in blob order, so the result containers need no locking
+            fetch = functools.partial(self._fetch_blob, container_client)
+            with ThreadPoolExecutor(max_workers=MAX_DOWNLOAD_WORKERS) as executor:
+                downloads = executor.map(fetch, [blob_name for blob_name, _ in jobs])
+
+                for (_, blob_date), downloader in zip(jobs, downloads):
+                    # Stream the blob chunk by chunk instead of holding the
+                    # whole file as bytes and again as a decoded string
+                    stream = io.BufferedReader(_ChunkStream(downloader.chunks()))
 
                     if log_type == "system":
-                        self._parse_system_logs(content, blob_date)
+                        self._parse_system_logs(
+                            io.TextIOWrapper(stream, encoding="utf-8"), blob_date
+                        )
                     elif log_type == "performance":
-                        self._parse_performance_data(content, blob_date)
+                        self._parse_performance_data(stream, blob_date)
 
         except Exception as e:
             logger.error(f"Error downloading {log_type} logs: {e}")
             raise
 
-    def _extract_date_from_blob_name(self, blob_name: str) -> Optional[datetime.date]:
+    def _fetch_blob(self, container_client, blob_name: str):
         """
-        Extract date from blob name (router-YYYY-MM-DD.log or YYYY-MM-DD.csv)
+        Start downloading a blob and return its StorageStreamDownloader
+
+        download_blob() already fetches the first range (the whole blob for
+        typical daily logs), which is the part run in worker threads.
         """
-        # Pattern for router-YYYY-MM-DD.log or YYYY-MM-DD.csv
-        date_pattern = r"(\d{4}-\d{2}-\d{2})"
-        match = re.search(date_pattern, blob_name)
+        logger.info(f"Downloading {blob_name}")
+        return container_client.get_blob_client(blob_name).download_blob()
 
-        if match:
-            try:
-                return datetime.strptime(match.group(1), "%Y-%m-%d").date()
-            except ValueError:
-                pass
+    def _parse_system_logs(
+        self, stream: io.TextIOBase, log_date: datetime.date
+    ) -> None:
+        """
+        Parse system log lines and extract relevant events
+        """
+        while True:
+            lines = stream.readlines(SYSTEM_LOG_CHUNK_CHARS)
+            if not lines:
+                break
 
-        return None
+            logs = self._parse_log_block("".join(lines), log_date)
+            self.log_frames.append(logs)
 
-    def _parse_system_logs(self, content: str, log_date: datetime.date) -> None:
+            # Identify specific event types
+            self.failover_frames.append(
+                self._find_events(logs, _FAILOVER_RE, "failover")
+            )
+            self.reboot_frames.append(self._find_events(logs, _REBOOT_RE, "reboot"))
+
+    def _parse_log_block(self, text: str, log_date: datetime.date) -> pd.DataFrame:
         """
-        Parse system logs and extract relevant events
+        Parse a block of log lines into a DataFrame of _LOG_FIELDS
+
+        Lines that are not log entries are skipped. Timestamps get the year
+        from log_date and are parsed in one vectorized call.
         """
-        lines = content.strip().split("\n")
+        logs = pd.DataFrame(_LOG_RE.findall(text), columns=list(_LOG_FIELDS))
 
-        for line in lines:
-            if not line.strip():
-                continue
+        timestamp_strs = logs["timestamp"]
+        logs["timestamp"] = pd.to_datetime(
+            f"{log_date.year} " + timestamp_strs,
+            format="%Y %b %d %H:%M:%S",
+            errors="coerce",
+        )
 
-            # Parse log entry
-            log_entry = self._parse_log_line(line, log_date)
-            if log_entry:
-                self.system_logs.append(log_entry)
+        invalid = logs["timestamp"].isna()
+        for timestamp_str in timestamp_strs[invalid]:
+            logger.warning(f"Could not parse timestamp: {timestamp_str}")
 
-                # Identify specific event types
-                self._identify_events(log_entry)
+        return logs[~invalid].reset_index(drop=True)
 
-    def _parse_log_line(self, line: str, log_date: datetime.date) -> Optional[Dict]:
+    def _find_events(
+        self, logs: pd.DataFrame, pattern: re.Pattern, event_type: str
+    ) -> pd.DataFrame:
         """
-        Parse a single log line into structured data
+        Return the events of the log entries whose message matches pattern
         """
-        # RUTOS log format: timestamp hostname process[pid]: message
-        # Example: Jul 14 10:30:45 RUTX50 kernel: [12345.678] message
+        matches = logs["message"].str.contains(pattern)
 
-        log_pattern = r"(\w{3}\s+\d{1,2}\s+\d{2}:\d{2}:\d{2})\s+(\w+)\s+([^:]+):\s*(.+)"
-        match = re.match(log_pattern, line)
+        return logs.loc[matches, ["timestamp", "message", "process"]].assign(
+            type=event_type
+        )[_EVENT_FIELDS]
 
-        if match:
-            timestamp_str, hostname, process, message = match.groups()
+    def _parse_performance_data(
+        self, stream: io.BufferedReader, log_date: datetime.date
+    ) -> None:
+        """
+        Parse CSV performance data from a binary stream
+        """
+        try:
+            has_header = stream.peek(9)[:9] == b"timestamp"
+
+            # Fields are matched by position; rows may be shorter (older
+            # files without GPS columns) and missing fields read as NaN
+            reader = pd.read_csv(
+                stream,
+                encoding="utf-8",
+                header=None,
+                names=_PERFORMANCE_COLUMNS,
+                index_col=False,
+                skiprows=1 if has_header else 0,
+                # Keep empty cells as "" so short lines can be recognized
+                keep_default_na=False,
+                dtype={column: str for column in _FLAG_COLUMNS + _TEXT_COLUMNS},
+                chunksize=PERFORMANCE_CHUNK_ROWS,
+            )
 
-            # Parse timestamp (add year from log_date)
-            try:
-                timestamp = datetime.strptime(
-                    f"{log_date.year} {timestamp_str}", "%Y %b %d %H:%M:%S"
-                )
+            for chunk in reader:
+                chunk = self._clean_performance_chunk(chunk)
+                self.performance_frames.append(chunk)
 
-                return {
-                    "timestamp": timestamp,
-                    "hostname": hostname,
-                    "process": process,
-                    "message": message,
-                    "raw_line": line,
-                }
-            except ValueError:
-                logger.warning(f"Could not parse timestamp: {timestamp_str}")
+                # Check for performance issues
+                self._check_performance_thresholds(chunk)
 
-        return None
+        except Exception as e:
+            logger.error(f"Error parsing performance data: {e}")
 
-    def _identify_events(self, log_entry: Dict) -> None:
+    def _clean_performance_chunk(self, chunk: pd.DataFrame) -> pd.DataFrame:
         """
-        Identify specific events from log entries
+        Type the columns of a parsed CSV chunk and fill in missing values
         """
-        message = log_entry["message"].lower()
-        timestamp = log_entry["timestamp"]
-
-        # Failover events
-        failover_keywords = [
-            "failover",
-            "switching to backup",
-            "starlink down",
-            "primary wan down",
-            "backup wan up",
-            "connection restored",
-            "wan failover",
-        ]
-
-        if any(keyword in message for keyword in failover_keywords):
-            self.failover_events.append(
-                {
-                    "timestamp": timestamp,
-                    "type": "failover",
-                    "message": log_entry["message"],
-                    "process": log_entry["process"],
-                }
+        # Fields missing from a short line read as "", like empty cells. The
+        # last non-empty field gives the line's length, so lines that end
+        # before the core metrics are dropped while empty cells within a
+        # line count as 0 below (a full line whose trailing core cells are
+        # all empty cannot be told from a short one and is dropped too)
+        filled = chunk.ne("").to_numpy()
+        n_fields = np.where(
+            filled.any(axis=1), filled.shape[1] - filled[:, ::-1].argmax(axis=1), 0
+        )
+        chunk = chunk[n_fields >= _MIN_PERFORMANCE_FIELDS].replace("", np.nan)
+
+        # Rows without a valid timestamp (header remnants, truncated lines)
+        # are dropped. Offsets such as "Z" are converted to UTC and dropped,
+        # so the timestamps compare with the naive syslog event times
+        chunk["timestamp"] = pd.to_datetime(
+            chunk["timestamp"], utc=True, format="ISO8601", errors="coerce"
+        ).dt.tz_localize(None)
+        # (usecols cannot be used to skip the unused columns: it rejects
+        # files with fewer columns than names)
+        chunk = chunk.dropna(subset=["timestamp"]).drop(columns=list(_UNUSED_COLUMNS))
+
+        # A value that is present but not a number invalidates its row
+        numeric = list(_ZERO_FILLED_COLUMNS + _GPS_COLUMNS + ("gps_satellites",))
+        present = chunk[numeric].notna()
+        chunk[numeric] = chunk[numeric].apply(pd.to_numeric, errors="coerce")
+        invalid = (present & chunk[numeric].isna()).any(axis=1)
+        if invalid.any():
+            logger.warning(
+                f"Skipping {invalid.sum()} performance rows with unparseable metrics"
             )
+            chunk = chunk[~invalid]
 
-        # Reboot events
-        reboot_keywords = [
-            "system startup",
-            "kernel:",
-            "init:",
-            "booting",
-            "system halt",
-            "restart",
-            "reboot",
-            "shutdown",
-        ]
+        chunk[list(_ZERO_FILLED_COLUMNS)] = chunk[list(_ZERO_FILLED_COLUMNS)].fillna(0)
+        chunk["gps_satellites"] = chunk["gps_satellites"].fillna(0).astype(int)
 
-        if any(keyword in message for keyword in reboot_keywords):
-            self.reboot_events.append(
-                {
-                    "timestamp": timestamp,
-                    "type": "reboot",
-                    "message": log_entry["message"],
-                    "process": log_entry["process"],
-                }
-            )
+        for column in _FLAG_COLUMNS:
+            chunk[column] = chunk[column].str.lower().eq("true")
 
-    def _parse_performance_data(self, content: str, log_date: datetime.date) -> None:
-        """
-        Parse CSV performance data
-        """
-        try:
-            # Parse CSV content
-            lines = content.strip().split("\n")
-            if not lines:
-                return
-
-            # Skip header if present
-            if lines[0].startswith("timestamp"):
-                lines = lines[1:]
-
-            for line in lines:
-                if not line.strip():
-                    continue
-
-                parts = line.split(",")
-                if len(parts) >= 8:  # Minimum expected columns
-                    try:
-                        # Parse CSV fields
-                        performance_entry = {
-                            "timestamp": datetime.fromisoformat(
-                                parts[0].replace("Z", "+00:00")
-                            ),
-                            "uptime_s": float(parts[1]) if parts[1] else 0,
-                            "downlink_throughput_bps": (
-                                float(parts[2]) if parts[2] else 0
-                            ),
-                            "uplink_throughput_bps": float(parts[3]) if parts[3] else 0,
-                            "ping_drop_rate": float(parts[4]) if parts[4] else 0,
-                            "ping_latency_ms": float(parts[5]) if parts[5] else 0,
-                            "obstruction_duration_s": (
-                                float(parts[6]) if parts[6] else 0
-                            ),
-                            "obstruction_fraction": float(parts[7]) if parts[7] else 0,
-                        }
-
-                        # Add additional fields if available
-                        if len(parts) > 8:
-                            performance_entry.update(
-                                {
-                                    "currently_obstructed": (
-                                        parts[8].lower() == "true"
-                                        if parts[8]
-                                        else False
-                                    ),
-                                    "snr": (
-                                        float(parts[9])
-                                        if len(parts) > 9 and parts[9]
-                                        else 0
-                                    ),
-                                    "alerts_thermal_throttle": (
-                                        parts[10].lower() == "true"
-                                        if len(parts) > 10 and parts[10]
-                                        else False
-                                    ),
-                                    "alerts_thermal_shutdown": (
-                                        parts[11].lower() == "true"
-                                        if len(parts) > 11 and parts[11]
-                                        else False
-                                    ),
-                                    "dishy_state": parts[13] if len(parts) > 13 else "",
-                                    "mobility_class": (
-                                        parts[14] if len(parts) > 14 else ""
-                                    ),
-                                }
-                            )
-
-                        # Add GPS data if available (new columns)
-                        if len(parts) > 18:
-                            performance_entry.update(
-                                {
-                                    "latitude": (
-                                        float(parts[18])
-                                        if parts[18] and parts[18] != ""
-                                        else None
-                                    ),
-                                    "longitude": (
-                                        float(parts[19])
-                                        if parts[19] and parts[19] != ""
-                                        else None
-                                    ),
-                                    "altitude_m": (
-                                        float(parts[20])
-                                        if len(parts) > 20
-                                        and parts[20]
-                                        and parts[20] != ""
-                                        else None
-                                    ),
-                                    "speed_kmh": (
-                                        float(parts[21])
-                                        if len(parts) > 21
-                                        and parts[21]
-                                        and parts[21] != ""
-                                        else None
-                                    ),
-                                    "heading_deg": (
-                                        float(parts[22])
-                                        if len(parts) > 22
-                                        and parts[22]
-                                        and parts[22] != ""
-                                        else None
-                                    ),
-                                    "gps_source": (
-                                        parts[23] if len(parts) > 23 else "none"
-                                    ),
-                                    "gps_satellites": (
-                                        int(parts[24])
-                                        if len(parts) > 24
-                                        and parts[24]
-                                        and parts[24] != ""
-                                        else 0
-                                    ),
-                                    "gps_accuracy_m": (
-                                        float(parts[25])
-                                        if len(parts) > 25
-                                        and parts[25]
-                                        and parts[25] != ""
-                                        else None
-                                    ),
-                                }
-                            )
-
-                        self.performance_data.append(performance_entry)
-
-                        # Check for performance issues
-                        self._check_performance_thresholds(performance_entry)
-
-                    except (ValueError, IndexError) as e:
-                        logger.warning(
-                            f"Could not parse performance line: {line[:100]}... Error: {e}"
-                        )
+        chunk["dishy_state"] = chunk["dishy_state"].fillna("")
+        chunk["mobility_class"] = chunk["mobility_class"].fillna("")
+        chunk["gps_source"] = chunk["gps_source"].fillna("none")
 
-        except Exception as e:
-            logger.error(f"Error parsing performance data: {e}")
+        return chunk
 
-    def _check_performance_thresholds(self, entry: Dict) -> None:
+    def _check_performance_thresholds(self, chunk: pd.DataFrame) -> None:
         """
         Check if performance metrics violate configured thresholds
         """
-        # Define threshold violations (adjust based on your requirements)
-        violations = []
+        latency = chunk["ping_latency_ms"].to_numpy()
+        packet_loss = chunk["ping_drop_rate"].to_numpy()
+        downlink = chunk["downlink_throughput_bps"].to_numpy()
+        obstruction = chunk["obstruction_fraction"].to_numpy()
 
-        # High latency threshold (adjust based on your setup)
-        if entry["ping_latency_ms"] > 600:  # 600ms
-            violations.append(f"High latency: {entry['ping_latency_ms']:.1f}ms")
-
-        # High packet loss threshold
-        if entry["ping_drop_rate"] > 0.05:  # 5%
-            violations.append(f"High packet loss: {entry['ping_drop_rate']*100:.1f}%")
+        # Define threshold violations (adjust based on your requirements)
+        high_latency = latency > 600  # 600ms
+        high_packet_loss = packet_loss > 0.05  # 5%
+        low_downlink = downlink < 10_000_000  # 10 Mbps
+        high_obstruction = obstruction > 0.02  # 2%
 
-        # Low throughput thresholds (adjust based on your requirements)
-        if entry["downlink_throughput_bps"] < 10_000_000:  # 10 Mbps
-            violations.append(
-                f"Low downlink: {entry['downlink_throughput_bps']/1_000_000:.1f} Mbps"
-            )
+        violating = np.flatnonzero(
+            high_latency | high_packet_loss | low_downlink | high_obstruction
+        )
+        if not len(violating):
+            return
 
-        # Obstruction issues
-        if entry["obstruction_fraction"] > 0.02:  # 2%
-            violations.append(
-                f"High obstruction: {entry['obstruction_fraction']*100:.1f}%"
-            )
+        # Messages are only formatted for the violating rows
+        messages = (
+            _flagged_messages(
+                high_latency[violating], "High latency: {:.1f}ms", latency[violating]
+            ),
+            _flagged_messages(
+                high_packet_loss[violating],
+                "High packet loss: {:.1f}%",
+                packet_loss[violating] * 100,
+            ),
+            _flagged_messages(
+                low_downlink[violating],
+                "Low downlink: {:.1f} Mbps",
+                downlink[violating] / 1_000_000,
+            ),
+            _flagged_messages(
+                high_obstruction[violating],
+                "High obstruction: {:.1f}%",
+                obstruction[violating] * 100,
+            ),
+        )
 
-        if violations:
-            self.threshold_violations.append(
-                {
-                    "timestamp": entry["timestamp"],
-                    "violations": violations,
-                    "metrics": entry,
-                }
-            )
+        violations = chunk.iloc[violating].copy()
+        violations["violations"] = [
+            [message for message in row if message] for row in zip(*messages)
+        ]
+        self.violation_frames.append(violations)
 
+    @_cached_analysis
     def analyze_failover_patterns(self) -> Dict:
         """
         Analyze failover frequency and patterns
         """
-        if not self.failover_events:
+        if self.failover_events.empty:
             return {"failover_count": 0, "message": "No failover events found"}
 
+        timestamps = self.failover_events["timestamp"].to_numpy()
+
         # Group failovers by day
-        daily_failovers = defaultdict(int)
-        for event in self.failover_events:
-            date_key = event["timestamp"].date()
-            daily_failovers[date_key] += 1
+        days, day_counts = np.unique(
+            timestamps.astype("datetime64[D]"), return_counts=True
+        )
 
         # Calculate statistics
         failover_count = len(self.failover_events)
-        days_with_failovers = len(daily_failovers)
+        days_with_failovers = len(days)
         avg_failovers_per_day = failover_count / max(days_with_failovers, 1)
 
-        # Find patterns
-        failover_hours = [event["timestamp"].hour for event in self.failover_events]
-        peak_hour = (
-            Counter(failover_hours).most_common(1)[0] if failover_hours else (0, 0)
-        )
+        # Find patterns; ties go to the earliest hour of the day
+        hours = timestamps.astype("datetime64[h]").astype(np.int64) % 24
+        hour_counts = np.bincount(hours, minlength=24)
+        peak_hour = int(hour_counts.argmax())
 
         return {
             "failover_count": failover_count,
             "days_with_failovers": days_with_failovers,
             "avg_failovers_per_day": avg_failovers_per_day,
-            "peak_hour": peak_hour[0],
-            "peak_hour_count": peak_hour[1],
-            "daily_distribution": dict(daily_failovers),
+            "peak_hour": peak_hour,
+            "peak_hour_count": int(hour_counts[peak_hour]),
+            "daily_distribution": dict(zip(days.astype(object), day_counts.tolist())),
         }
 
+    @_cached_analysis
     def analyze_performance_trends(self) -> Dict:
         """
         Analyze Starlink performance trends including GPS-based insights
         """
-        if not self.performance_data:
+        if self.perf_df.empty:
             return {"message": "No performance data found"}
 
-        # Convert to DataFrame for easier analysis
-        df = pd.DataFrame(self.performance_data)
-        df["timestamp"] = pd.to_datetime(df["timestamp"])
-        df.set_index("timestamp", inplace=True)
+        df = self.perf_df
 
         # Calculate daily averages
         daily_stats = (
@@ -513,34 +862,54 @@ class NetworkAnalyzer:
         gps_analysis = self.analyze_gps_patterns()
         mobility_analysis = self.analyze_mobility_patterns()
 
+        # Overall averages in one reduction over the float block
+        means = df[
+            [
+                "ping_latency_ms",
+                "ping_drop_rate",
+                "downlink_throughput_bps",
+                "uplink_throughput_bps",
+                "obstruction_fraction",
+            ]
+        ].mean()
+
         return {
             "total_measurements": len(df),
-            "avg_latency": df["ping_latency_ms"].mean(),
-            "avg_packet_loss": df["ping_drop_rate"].mean() * 100,
-            "avg_downlink_mbps": df["downlink_throughput_bps"].mean() / 1_000_000,
-            "avg_uplink_mbps": df["uplink_throughput_bps"].mean() / 1_000_000,
-            "avg_obstruction_pct": df["obstruction_fraction"].mean() * 100,
+            "avg_latency": means["ping_latency_ms"],
+            "avg_packet_loss": means["ping_drop_rate"] * 100,
+            "avg_downlink_mbps": means["downlink_throughput_bps"] / 1_000_000,
+            "avg_uplink_mbps": means["uplink_throughput_bps"] / 1_000_000,
+            "avg_obstruction_pct": means["obstruction_fraction"] * 100,
             "degradation_events": degradation_count,
             "daily_stats": daily_stats,
             "gps_analysis": gps_analysis,
             "mobility_analysis": mobility_analysis,
         }
 
+    @_cached_analysis
+    def _gps_data(self) -> pd.DataFrame:
+        """
+        Performance samples with a GPS position, shared by analyses and plots
+        """
+        return self.performance_data.dropna(subset=["latitude", "longitude"])
+
+    @_cached_analysis
+    def _mobile_data(self) -> pd.DataFrame:
+        """
+        Performance samples with a speed reading
+        """
+        return self.performance_data.dropna(subset=["speed_kmh"])
+
+    @_cached_analysis
     def analyze_gps_patterns(self) -> Dict:
         """
         Analyze GPS data patterns and location-based performance
         """
-        gps_data = [
-            p
-            for p in self.performance_data
-            if p.get("latitude") is not None and p.get("longitude") is not None
-        ]
+        df = self._gps_data()
 
-        if not gps_data:
+        if df.empty:
             return {"message": "No GPS data available"}
 
-        df = pd.DataFrame(gps_data)
-
         # Basic GPS statistics
         location_count = len(df)
         unique_locations = len(df.groupby(["latitude", "longitude"]))
@@ -567,29 +936,40 @@ class NetworkAnalyzer:
             "location_performance": location_performance,
         }
 
+    @_cached_analysis
     def analyze_mobility_patterns(self) -> Dict:
         """
         Analyze mobility patterns and performance correlation
         """
-        mobile_data = [
-            p for p in self.performance_data if p.get("speed_kmh") is not None
-        ]
+        df = self._mobile_data()
 
-        if not mobile_data:
+        if df.empty:
             return {"message": "No mobility data available"}
 
-        df = pd.DataFrame(mobile_data)
-
         # Speed statistics
         avg_speed = df["speed_kmh"].mean() if "speed_kmh" in df.columns else 0
         max_speed = df["speed_kmh"].max() if "speed_kmh" in df.columns else 0
 
-        # Classify by mobility state
-        df["mobility_state"] = df["speed_kmh"].apply(self._classify_mobility_state)
-        mobility_distribution = df["mobility_state"].value_counts().to_dict()
+        # Classify by mobility state as integer codes into _MOBILITY_STATES;
+        # names are only attached to the (few) results
+        mobility_codes = pd.cut(
+            df["speed_kmh"].to_numpy(),
+            bins=_MOBILITY_SPEED_BINS,
+            labels=False,
+            right=False,
+        )
+        mobility_distribution = {
+            _MOBILITY_STATES[code]: count
+            for code, count in pd.Series(mobility_codes)
+            .value_counts()
+            .to_dict()
+            .items()
+        }
 
         # Performance correlation with speed
-        speed_performance_correlation = self._analyze_speed_performance_correlation(df)
+        speed_performance_correlation = self._analyze_speed_performance_correlation(
+            df, mobility_codes
+        )
 
         return {
             "avg_speed_kmh": round(avg_speed, 2),
@@ -606,40 +986,35 @@ class NetworkAnalyzer:
             return {"message": "Insufficient data for movement analysis"}
 
         # Calculate distances between consecutive points
-        distances = []
-        total_distance = 0
-
-        for i in range(1, len(df)):
-            prev_lat, prev_lon = df.iloc[i - 1]["latitude"], df.iloc[i - 1]["longitude"]
-            curr_lat, curr_lon = df.iloc[i]["latitude"], df.iloc[i]["longitude"]
+        lat = df["latitude"].to_numpy(dtype=np.float64)
+        lon = df["longitude"].to_numpy(dtype=np.float64)
+        distances = _haversine_km(lat[:-1], lon[:-1], lat[1:], lon[1:])
 
-            distance = self._calculate_distance(prev_lat, prev_lon, curr_lat, curr_lon)
-            distances.append(distance)
-            total_distance += distance
-
-        avg_distance_per_measurement = (
-            sum(distances) / len(distances) if distances else 0
-        )
+        total_distance = float(distances.sum())
+        avg_distance_per_measurement = total_distance / len(distances)
 
         return {
             "total_distance_km": round(total_distance, 2),
             "avg_distance_per_measurement_m": round(
                 avg_distance_per_measurement * 1000, 2
             ),
-            "max_distance_between_points_m": (
-                round(max(distances) * 1000, 2) if distances else 0
-            ),
+            "max_distance_between_points_m": round(float(distances.max()) * 1000, 2),
         }
 
     def _analyze_location_performance(self, df: pd.DataFrame) -> Dict:
         """
         Analyze performance patterns by location
         """
-        # Group by approximate location (rounded to ~100m precision)
-        df["lat_rounded"] = (df["latitude"] * 1000).round() / 1000
-        df["lon_rounded"] = (df["longitude"] * 1000).round() / 1000
+        # Group by approximate location (rounded to ~100m precision), packed
+        # into one int64 key per point; that hashes far cheaper than a pair
+        # of float columns
+        lat_key = np.rint(df["latitude"].to_numpy(dtype=np.float64) * 1000)
+        lon_key = np.rint(df["longitude"].to_numpy(dtype=np.float64) * 1000)
+        location_keys = (lat_key.astype(np.int64) + 90_000) * _LON_KEYS + (
+            lon_key.astype(np.int64) + 180_000
+        )
 
-        location_groups = df.groupby(["lat_rounded", "lon_rounded"])
+        location_groups = df.groupby(location_keys)
 
         # Find best and worst performing locations
         location_performance = location_groups.agg(
@@ -650,6 +1025,13 @@ class NetworkAnalyzer:
             }
         ).round(2)
 
+        # Unpack the keys into (lat, lon) pairs, as the old two-column groupby
+        # produced them
+        keys = location_performance.index.to_numpy()
+        location_performance.index = pd.MultiIndex.from_arrays(
+            [(keys // _LON_KEYS - 90_000) / 1000, (keys % _LON_KEYS - 180_000) / 1000]
+        )
+
         if len(location_performance) > 0:
             best_latency_location = location_performance["ping_latency_ms"].idxmin()
             worst_latency_location = location_performance["ping_latency_ms"].idxmax()
@@ -716,55 +1098,15 @@ class NetworkAnalyzer:
 
         return round(lat_km * lon_km, 2)
 
-    def _calculate_distance(
-        self, lat1: float, lon1: float, lat2: float, lon2: float
-    ) -> float:
-        """
-        Calculate distance between two GPS points using Haversine formula (returns km)
-        """
-        import math
-
-        # Convert to radians
-        lat1, lon1, lat2, lon2 = map(math.radians, [lat1, lon1, lat2, lon2])
-
-        # Haversine formula
-        dlat = lat2 - lat1
-        dlon = lon2 - lon1
-        a = (
-            math.sin(dlat / 2) ** 2
-            + math.cos(lat1) * math.cos(lat2) * math.sin(dlon / 2) ** 2
-        )
-        c = 2 * math.asin(math.sqrt(a))
-
-        # Earth radius in km
-        r = 6371
-
-        return c * r
-
-    def _classify_mobility_state(self, speed_kmh: float) -> str:
-        """
-        Classify mobility state based on speed
-        """
-        if speed_kmh < 1:
-            return "stationary"
-        elif speed_kmh < 5:
-            return "walking"
-        elif speed_kmh < 25:
-            return "cycling"
-        elif speed_kmh < 60:
-            return "driving_urban"
-        elif speed_kmh < 100:
-            return "driving_highway"
-        else:
-            return "high_speed"
-
-    def _analyze_speed_performance_correlation(self, df: pd.DataFrame) -> Dict:
+    def _analyze_speed_performance_correlation(
+        self, df: pd.DataFrame, mobility_codes: np.ndarray
+    ) -> Dict:
         """
         Analyze correlation between speed and network performance
         """
         # Group by mobility state
         mobility_performance = (
-            df.groupby("mobility_state")
+            df.groupby(mobility_codes)
             .agg(
                 {
                     "ping_latency_ms": "mean",
@@ -775,6 +1117,9 @@ class NetworkAnalyzer:
             )
             .round(2)
         )
+        mobility_performance.index = [
+            _MOBILITY_STATES[code] for code in mobility_performance.index
+        ]
 
         # Calculate correlations
         correlations = {}
@@ -792,97 +1137,77 @@ class NetworkAnalyzer:
             "speed_correlations": correlations,
         }
 
+    @_cached_analysis
     def correlate_events_and_performance(self) -> Dict:
         """
         Correlate system events with performance degradation
         """
-        correlations = []
-
-        # Check performance around reboot events
-        for reboot in self.reboot_events:
-            reboot_time = reboot["timestamp"]
-
-            # Find performance data within 1 hour before/after reboot
-            relevant_performance = [
-                p
-                for p in self.performance_data
-                if abs((p["timestamp"] - reboot_time).total_seconds()) <= 3600
-            ]
+        # Performance within 1 hour of reboots and 30 minutes of failovers
+        correlations = self._correlate_events(
+            self.reboot_events, "reboot", timedelta(hours=1)
+        ) + self._correlate_events(
+            self.failover_events, "failover", timedelta(minutes=30)
+        )
 
-            if relevant_performance:
-                avg_latency = sum(
-                    p["ping_latency_ms"] for p in relevant_performance
-                ) / len(relevant_performance)
-                avg_loss = sum(p["ping_drop_rate"] for p in relevant_performance) / len(
-                    relevant_performance
-                )
+        return {"correlations_found": len(correlations), "events": correlations}
 
-                correlations.append(
-                    {
-                        "event_type": "reboot",
-                        "timestamp": reboot_time,
-                        "performance_samples": len(relevant_performance),
-                        "avg_latency_ms": avg_latency,
-                        "avg_packet_loss_pct": avg_loss * 100,
-                    }
-                )
+    def _correlate_events(
+        self, events: pd.DataFrame, event_type: str, half_width: timedelta
+    ) -> List[Dict]:
+        """
+        Summarize the performance samples within half_width of each event
 
-        # Check performance around failover events
-        for failover in self.failover_events:
-            failover_time = failover["timestamp"]
+        perf_df is sorted by time, so the windows of all events are found by
+        two vectorized binary searches, and every window mean is a difference
+        of two prefix sums: O(N + E log N) however wide the windows are.
+        """
+        if events.empty or self.perf_df.empty:
+            return []
 
-            # Find performance data within 30 minutes before/after failover
-            relevant_performance = [
-                p
-                for p in self.performance_data
-                if abs((p["timestamp"] - failover_time).total_seconds()) <= 1800
-            ]
+        timestamps = self.perf_df.index.to_numpy()
+        event_times = events["timestamp"].to_numpy().astype(timestamps.dtype)
+        half_width = np.timedelta64(half_width)
+        starts = np.searchsorted(timestamps, event_times - half_width, "left")
+        ends = np.searchsorted(timestamps, event_times + half_width, "right")
 
-            if relevant_performance:
-                avg_latency = sum(
-                    p["ping_latency_ms"] for p in relevant_performance
-                ) / len(relevant_performance)
-                avg_loss = sum(p["ping_drop_rate"] for p in relevant_performance) / len(
-                    relevant_performance
-                )
+        counts = ends - starts
+        found = counts > 0
+        starts, ends, counts = starts[found], ends[found], counts[found]
 
-                correlations.append(
-                    {
-                        "event_type": "failover",
-                        "timestamp": failover_time,
-                        "performance_samples": len(relevant_performance),
-                        "avg_latency_ms": avg_latency,
-                        "avg_packet_loss_pct": avg_loss * 100,
-                    }
-                )
+        latency_sums = _prefix_sums(self.perf_df["ping_latency_ms"])
+        loss_sums = _prefix_sums(self.perf_df["ping_drop_rate"])
+        avg_latency = (latency_sums[ends] - latency_sums[starts]) / counts
+        avg_loss = (loss_sums[ends] - loss_sums[starts]) / counts
 
-        return {"correlations_found": len(correlations), "events": correlations}
+        return [
+            {
+                "event_type": event_type,
+                "timestamp": timestamp,
+                "performance_samples": samples,
+                "avg_latency_ms": latency,
+                "avg_packet_loss_pct": loss * 100,
+            }
+            for timestamp, samples, latency, loss in zip(
+                events["timestamp"][found].dt.to_pydatetime(),
+                counts.tolist(),
+                avg_latency.tolist(),
+                avg_loss.tolist(),
+            )
+        ]
 
+    @_cached_analysis
     def generate_threshold_recommendations(self) -> Dict:
         """
         Generate threshold optimization recommendations
         """
-        if not self.performance_data:
+        if self.performance_data.empty:
             return {"message": "Insufficient data for recommendations"}
 
         # Calculate percentiles for key metrics
-        latencies = [p["ping_latency_ms"] for p in self.performance_data]
-        packet_losses = [p["ping_drop_rate"] for p in self.performance_data]
-        throughputs = [p["downlink_throughput_bps"] for p in self.performance_data]
-
-        # Calculate statistics
-        latency_95th = sorted(latencies)[int(len(latencies) * 0.95)] if latencies else 0
-        latency_99th = sorted(latencies)[int(len(latencies) * 0.99)] if latencies else 0
-
-        packet_loss_95th = (
-            sorted(packet_losses)[int(len(packet_losses) * 0.95)]
-            if packet_losses
-            else 0
-        )
-
-        throughput_5th = (
-            sorted(throughputs)[int(len(throughputs) * 0.05)] if throughputs else 0
-        )
+        perf = self.performance_data
+        latency_95th, latency_99th = _percentiles(perf["ping_latency_ms"], 0.95, 0.99)
+        (packet_loss_95th,) = _percentiles(perf["ping_drop_rate"], 0.95)
+        (throughput_5th,) = _percentiles(perf["downlink_throughput_bps"], 0.05)
 
         # Generate recommendations
         recommendations = {
@@ -909,7 +1234,7 @@ class NetworkAnalyzer:
                 "total_violations": len(self.threshold_violations),
                 "violation_rate_pct": (
                     len(self.threshold_violations) / len(self.performance_data) * 100
-                    if self.performance_data
+                    if len(self.performance_data)
                     else 0
                 ),
             },
@@ -924,76 +1249,95 @@ class NetworkAnalyzer:
         Path(output_dir).mkdir(exist_ok=True)
 
         # Set style
-        plt.style.use("seaborn-v0_8")
-        sns.set_palette("husl")
+        _import_plotting()
+        _set_plot_style()
 
         try:
+            # Each chart is a _plot_* method and the data it draws
+            jobs = []
+            perf = self.performance_data
+
             # 1. Performance trends over time
-            if self.performance_data:
-                self._plot_performance_trends(output_dir)
+            if not perf.empty:
+                jobs.append(("_plot_performance_trends", perf))
 
             # 2. Event timeline
-            if self.failover_events or self.reboot_events:
-                self._plot_event_timeline(output_dir)
+            if not (self.failover_events.empty and self.reboot_events.empty):
+                jobs.append(
+                    ("_plot_event_timeline", self.failover_events, self.reboot_events)
+                )
 
             # 3. Threshold violations
-            if self.threshold_violations:
-                self._plot_threshold_violations(output_dir)
+            if not self.threshold_violations.empty:
+                jobs.append(("_plot_threshold_violations", self.threshold_violations))
 
             # 4. GPS and mobility visualizations
-            gps_data = [
-                p for p in self.performance_data if p.get("latitude") is not None
-            ]
-            if gps_data:
-                self._plot_gps_coverage(output_dir, gps_data)
-                self._plot_performance_by_location(output_dir, gps_data)
+            gps_data = self._gps_data()
+            if not gps_data.empty:
+                jobs.append(("_plot_gps_coverage", gps_data))
+                jobs.append(("_plot_performance_by_location", gps_data))
 
             # 5. Speed and mobility analysis
-            mobile_data = [
-                p for p in self.performance_data if p.get("speed_kmh") is not None
-            ]
-            if mobile_data:
-                self._plot_mobility_analysis(output_dir, mobile_data)
+            mobile_data = self._mobile_data()
+            if not mobile_data.empty:
+                jobs.append(("_plot_mobility_analysis", mobile_data))
+
+            # The charts are independent figures saved to their own files, so
+            # they can rasterize and encode in parallel processes
+            workers = min(os.cpu_count() or 1, MAX_PLOT_WORKERS, len(jobs))
+            if workers > 1:
+                with ProcessPoolExecutor(max_workers=workers) as executor:
+                    futures = [
+                        executor.submit(_render_plot, name, output_dir, *data)
+                        for name, *data in jobs
+                    ]
+                for future in futures:
+                    future.result()
+            else:
+                for name, *data in jobs:
+                    getattr(self, name)(output_dir, *data)
 
             logger.info(f"Visualizations saved to {output_dir}/")
 
         except Exception as e:
             logger.error(f"Error creating visualizations: {e}")
 
-    def _plot_performance_trends(self, output_dir: str) -> None:
+    @staticmethod
+    def _plot_performance_trends(output_dir: str, df: pd.DataFrame) -> None:
         """
         Plot performance metrics over time
         """
-        df = pd.DataFrame(self.performance_data)
-        df["timestamp"] = pd.to_datetime(df["timestamp"])
+        # The four axes share one time axis; convert it to Matplotlib date
+        # numbers once rather than once per line, and pass plain arrays
+        # thinned to what the subplots can show
+        times = mdates.date2num(df["timestamp"].to_numpy())
+
+        def column(name: str, scale: float = 1) -> Tuple[np.ndarray, np.ndarray]:
+            return _decimate(times, df[name].to_numpy() * scale)
 
         fig, axes = plt.subplots(2, 2, figsize=(15, 10))
         fig.suptitle("Starlink Performance Trends", fontsize=16)
 
         # Latency
-        axes[0, 0].plot(df["timestamp"], df["ping_latency_ms"], alpha=0.7)
+        axes[0, 0].plot(*column("ping_latency_ms"), alpha=0.7)
         axes[0, 0].set_title("Ping Latency")
         axes[0, 0].set_ylabel("Latency (ms)")
         axes[0, 0].grid(True)
 
         # Packet Loss
-        axes[0, 1].plot(
-            df["timestamp"], df["ping_drop_rate"] * 100, alpha=0.7, color="red"
-        )
+        axes[0, 1].plot(*column("ping_drop_rate", 100), alpha=0.7, color="red")
         axes[0, 1].set_title("Packet Loss")
         axes[0, 1].set_ylabel("Packet Loss (%)")
         axes[0, 1].grid(True)
 
         # Throughput
         axes[1, 0].plot(
-            df["timestamp"],
-            df["downlink_throughput_bps"] / 1_000_000,
+            *column("downlink_throughput_bps", 1e-6),
             alpha=0.7,
             label="Downlink",
         )
         axes[1, 0].plot(
-            df["timestamp"],
-            df["uplink_throughput_bps"] / 1_000_000,
+            *column("uplink_throughput_bps", 1e-6),
             alpha=0.7,
             label="Uplink",
         )
@@ -1003,9 +1347,7 @@ class NetworkAnalyzer:
         axes[1, 0].grid(True)
 
         # Obstructions
-        axes[1, 1].plot(
-            df["timestamp"], df["obstruction_fraction"] * 100, alpha=0.7, color="orange"
-        )
+        axes[1, 1].plot(*column("obstruction_fraction", 100), alpha=0.7, color="orange")
         axes[1, 1].set_title("Obstruction Fraction")
         axes[1, 1].set_ylabel("Obstruction (%)")
         axes[1, 1].grid(True)
@@ -1022,15 +1364,18 @@ class NetworkAnalyzer:
         )
         plt.close()
 
-    def _plot_event_timeline(self, output_dir: str) -> None:
+    @staticmethod
+    def _plot_event_timeline(
+        output_dir: str, failover_events: pd.DataFrame, reboot_events: pd.DataFrame
+    ) -> None:
         """
         Plot system events timeline
         """
         fig, ax = plt.subplots(figsize=(15, 6))
 
         # Plot failover events
-        if self.failover_events:
-            failover_times = [event["timestamp"] for event in self.failover_events]
+        if not failover_events.empty:
+            failover_times = failover_events["timestamp"]
             ax.scatter(
                 failover_times,
                 [1] * len(failover_times),
@@ -1041,8 +1386,8 @@ class NetworkAnalyzer:
             )
 
         # Plot reboot events
-        if self.reboot_events:
-            reboot_times = [event["timestamp"] for event in self.reboot_events]
+        if not reboot_events.empty:
+            reboot_times = reboot_events["timestamp"]
             ax.scatter(
                 reboot_times,
                 [2] * len(reboot_times),
@@ -1067,24 +1412,22 @@ class NetworkAnalyzer:
         plt.savefig(f"{output_dir}/events_timeline.png", dpi=300, bbox_inches="tight")
         plt.close()
 
-    def _plot_threshold_violations(self, output_dir: str) -> None:
+    @staticmethod
+    def _plot_threshold_violations(output_dir: str, violations: pd.DataFrame) -> None:
         """
         Plot threshold violations over time
         """
-        if not self.threshold_violations:
+        if violations.empty:
             return
 
         # Group violations by day
-        daily_violations = defaultdict(int)
-        for violation in self.threshold_violations:
-            date_key = violation["timestamp"].date()
-            daily_violations[date_key] += 1
-
-        dates = list(daily_violations.keys())
-        counts = list(daily_violations.values())
+        timestamps = violations["timestamp"]
+        daily_violations = timestamps.groupby(timestamps.dt.normalize()).size()
 
         plt.figure(figsize=(12, 6))
-        plt.bar(dates, counts, alpha=0.7, color="red")
+        plt.bar(
+            daily_violations.index, daily_violations.to_numpy(), alpha=0.7, color="red"
+        )
         plt.title("Threshold Violations by Day")
         plt.xlabel("Date")
         plt.ylabel("Violation Count")
@@ -1096,25 +1439,19 @@ class NetworkAnalyzer:
         )
         plt.close()
 
-    def _plot_gps_coverage(self, output_dir: str, gps_data: List[Dict]) -> None:
+    @staticmethod
+    def _plot_gps_coverage(output_dir: str, df: pd.DataFrame) -> None:
         """
         Plot GPS coverage map with performance overlays
         """
-        df = pd.DataFrame(gps_data)
-
         if len(df) < 2:
             return
 
         fig, (ax1, ax2) = plt.subplots(1, 2, figsize=(15, 6))
 
         # Coverage map
-        scatter = ax1.scatter(
-            df["longitude"],
-            df["latitude"],
-            c=df["ping_latency_ms"],
-            cmap="RdYlBu_r",
-            s=20,
-            alpha=0.7,
+        scatter = NetworkAnalyzer._coverage_layer(
+            ax1, df, df["ping_latency_ms"], "RdYlBu_r"
         )
         ax1.set_title("Coverage Map - Colored by Latency")
         ax1.set_xlabel("Longitude")
@@ -1122,13 +1459,8 @@ class NetworkAnalyzer:
         plt.colorbar(scatter, ax=ax1, label="Latency (ms)")
 
         # Throughput map
-        scatter2 = ax2.scatter(
-            df["longitude"],
-            df["latitude"],
-            c=df["downlink_throughput_bps"] / 1_000_000,
-            cmap="RdYlGn",
-            s=20,
-            alpha=0.7,
+        scatter2 = NetworkAnalyzer._coverage_layer(
+            ax2, df, df["downlink_throughput_bps"] / 1_000_000, "RdYlGn"
         )
         ax2.set_title("Coverage Map - Colored by Throughput")
         ax2.set_xlabel("Longitude")
@@ -1139,14 +1471,36 @@ class NetworkAnalyzer:
         plt.savefig(f"{output_dir}/gps_coverage_map.png", dpi=300, bbox_inches="tight")
         plt.close()
 
-    def _plot_performance_by_location(
-        self, output_dir: str, gps_data: List[Dict]
-    ) -> None:
+    @staticmethod
+    def _coverage_layer(ax, df: pd.DataFrame, values: pd.Series, cmap: str):
         """
-        Plot performance metrics correlation with location
+        Draw values at their GPS positions and return the mappable
         """
-        df = pd.DataFrame(gps_data)
+        if len(df) > HEXBIN_MIN_POINTS:
+            return ax.hexbin(
+                df["longitude"],
+                df["latitude"],
+                C=values,
+                reduce_C_function=np.mean,
+                gridsize=100,
+                cmap=cmap,
+            )
 
+        return ax.scatter(
+            df["longitude"],
+            df["latitude"],
+            c=values,
+            cmap=cmap,
+            s=20,
+            alpha=0.7,
+            rasterized=True,
+        )
+
+    @staticmethod
+    def _plot_performance_by_location(output_dir: str, df: pd.DataFrame) -> None:
+        """
+        Plot performance metrics correlation with location
+        """
         if len(df) < 10:
             return
 
@@ -1154,14 +1508,18 @@ class NetworkAnalyzer:
         fig.suptitle("Performance vs Location Analysis", fontsize=16)
 
         # Latency vs Latitude
-        axes[0, 0].scatter(df["latitude"], df["ping_latency_ms"], alpha=0.6)
+        axes[0, 0].scatter(
+            df["latitude"], df["ping_latency_ms"], alpha=0.6, rasterized=True
+        )
         axes[0, 0].set_title("Latency vs Latitude")
         axes[0, 0].set_xlabel("Latitude")
         axes[0, 0].set_ylabel("Latency (ms)")
         axes[0, 0].grid(True, alpha=0.3)
 
         # Latency vs Longitude
-        axes[0, 1].scatter(df["longitude"], df["ping_latency_ms"], alpha=0.6)
+        axes[0, 1].scatter(
+            df["longitude"], df["ping_latency_ms"], alpha=0.6, rasterized=True
+        )
         axes[0, 1].set_title("Latency vs Longitude")
         axes[0, 1].set_xlabel("Longitude")
         axes[0, 1].set_ylabel("Latency (ms)")
@@ -1173,6 +1531,7 @@ class NetworkAnalyzer:
             df["downlink_throughput_bps"] / 1_000_000,
             alpha=0.6,
             color="green",
+            rasterized=True,
         )
         axes[1, 0].set_title("Throughput vs Latitude")
         axes[1, 0].set_xlabel("Latitude")
@@ -1185,6 +1544,7 @@ class NetworkAnalyzer:
             df["downlink_throughput_bps"] / 1_000_000,
             alpha=0.6,
             color="green",
+            rasterized=True,
         )
         axes[1, 1].set_title("Throughput vs Longitude")
         axes[1, 1].set_xlabel("Longitude")
@@ -1197,24 +1557,23 @@ class NetworkAnalyzer:
         )
         plt.close()
 
-    def _plot_mobility_analysis(self, output_dir: str, mobile_data: List[Dict]) -> None:
+    @staticmethod
+    def _plot_mobility_analysis(output_dir: str, df: pd.DataFrame) -> None:
         """
         Plot mobility and speed analysis
         """
-        df = pd.DataFrame(mobile_data)
-
         if len(df) < 10:
             return
 
         fig, axes = plt.subplots(2, 2, figsize=(15, 10))
         fig.suptitle("Mobility and Speed Analysis", fontsize=16)
 
-        # Speed over time
-        df_time = df.copy()
-        df_time["timestamp"] = pd.to_datetime(df_time["timestamp"])
-        df_time = df_time.sort_values("timestamp")
-
-        axes[0, 0].plot(df_time["timestamp"], df_time["speed_kmh"], alpha=0.7)
+        # Speed over time; the rows are already in time order with datetime64
+        # timestamps, as performance_data is
+        axes[0, 0].plot(
+            *_decimate(df["timestamp"].to_numpy(), df["speed_kmh"].to_numpy()),
+            alpha=0.7,
+        )
         axes[0, 0].set_title("Speed Over Time")
         axes[0, 0].set_ylabel("Speed (km/h)")
         axes[0, 0].grid(True, alpha=0.3)
@@ -1222,7 +1581,9 @@ class NetworkAnalyzer:
         plt.setp(axes[0, 0].xaxis.get_majorticklabels(), rotation=45)
 
         # Speed vs Latency
-        axes[0, 1].scatter(df["speed_kmh"], df["ping_latency_ms"], alpha=0.6)
+        axes[0, 1].scatter(
+            df["speed_kmh"], df["ping_latency_ms"], alpha=0.6, rasterized=True
+        )
         axes[0, 1].set_title("Speed vs Latency")
         axes[0, 1].set_xlabel("Speed (km/h)")
         axes[0, 1].set_ylabel("Latency (ms)")
@@ -1234,6 +1595,7 @@ class NetworkAnalyzer:
             df["downlink_throughput_bps"] / 1_000_000,
             alpha=0.6,
             color="green",
+            rasterized=True,
         )
         axes[1, 0].set_title("Speed vs Throughput")
         axes[1, 0].set_xlabel("Speed (km/h)")
@@ -1264,13 +1626,13 @@ class NetworkAnalyzer:
                 "performance_data_points": len(self.performance_data),
                 "analysis_period": {
                     "start": (
-                        min(p["timestamp"] for p in self.performance_data).isoformat()
-                        if self.performance_data
+                        self.performance_data["timestamp"].min().isoformat()
+                        if not self.performance_data.empty
                         else None
                     ),
                     "end": (
-                        max(p["timestamp"] for p in self.performance_data).isoformat()
-                        if self.performance_data
+                        self.performance_data["timestamp"].max().isoformat()
+                        if not self.performance_data.empty
                         else None
                     ),
                 },
@@ -1282,8 +1644,8 @@ class NetworkAnalyzer:
         }
 
         # Save report
-        with open(output_file, "w") as f:
-            json.dump(report, f, indent=2, default=str)
+        with open(output_file, "wb") as f:
+            f.write(_dumps(report, orjson.OPT_INDENT_2))
 
         logger.info(f"Analysis report saved to {output_file}")
         return report
@@ -1,26 +1,29 @@
 #!/usr/bin/env python3
 import re
 
+SCRIPT = "Starlink-RUTOS-Failover/starlink_monitor_unified-rutos.sh"
+
+# Both patterns are ASCII, so they run on the raw bytes; the file is never
+# decoded and re-encoded
+# Pattern 1: tr -d with embedded newlines in cellular monitoring
+TR_NEWLINES_RE = re.compile(
+    rb"(\| tr -d ')([^']*\n[^']*)(,' \| head -c \d+\))", re.MULTILINE
+)
+# Pattern 2: sed pattern that's broken
+BROKEN_SED_RE = re.compile(rb'(sed \'s/\.\*"\\(\[^\^"]\*\\)"\.\*/)/(\' \| tr)')
+
 # Read the file
-with open("Starlink-RUTOS-Failover/starlink_monitor_unified-rutos.sh", "r") as f:
+with open(SCRIPT, "rb") as f:
     content = f.read()
 
 # Fix the problematic tr commands that have embedded newlines
-# Pattern 1: tr -d with embedded newlines in cellular monitoring
-content = re.sub(
-    r"(\| tr -d ')([^']*\n[^']*)(,' \| head -c \d+\))",
-    r"\1\\n\\r\3",
-    content,
-    flags=re.MULTILINE,
-)
+content = TR_NEWLINES_RE.sub(rb"\1\\n\\r\3", content)
 
 # Also fix sed pattern that's broken
-content = re.sub(
-    r'(sed \'s/\.\*"\\(\[^\^"]\*\\)"\.\*/)/(\' \| tr)', r"\1\\1/' | tr", content
-)
+content = BROKEN_SED_RE.sub(rb"\1\\1/' | tr", content)
 
 # Write the fixed content back
-with open("Starlink-RUTOS-Failover/starlink_monitor_unified-rutos.sh", "w") as f:
+with open(SCRIPT, "wb") as f:
     f.write(content)
 
 print("Fixed quote issues in the shell script")